@@ -1,24 +1,39 @@
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import os
 import re
-from .SingleGame import SingleGame, parseDate, extractTimeControl
+from .SingleGame import SingleGame, parseDate, extractTimeControl, configureEngine
 from .Enums import ChessColor, ChessResult
 from .MoveStats import MoveStatistics
-from .OpeningData import OpeningData
+from .OpeningData import OpeningData, updateMostCommon
 from .PlotFactory import PlotFactory
 from . import Constants
-from functools import wraps
-from typing import Callable, Tuple, Any, Union
+from functools import wraps, lru_cache
+from copy import copy
+from itertools import groupby, islice
+from operator import itemgetter
+from typing import Callable, Tuple, Any, Union, TextIO, Iterator
 import inspect
 import csv
+import heapq
+import numpy as np
 from stockfish import Stockfish
 
-
-def _extractMetaData(content: str, extractionPara: str) -> str:
-    extractionPara += ' "'
-    start_index = content.find(extractionPara) + len(extractionPara)
-    end_index = content.find('"', start_index)
-    return content[start_index:end_index]
+_BLACK_MOVE_NUMBER_RE = re.compile(Constants.BLACK_MOVE_NUMBER_PATTERN)
+_WHITE_MOVE_NUMBER_NO_END_LINE_RE = re.compile(Constants.WHITE_MOVE_NUMBER_PATTERN_NO_END_LINE)
+_WHITE_MOVE_NUMBER_END_OF_LINE_RE = re.compile(Constants.WHITE_MOVE_NUMBER_PATTERN_END_OF_LINE)
+# The four clock formats never overlap, so a single alternation is equivalent to applying them one after another.
+_CLK_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in (Constants.CLK_PATTERN_1, Constants.CLK_PATTERN_2,
+                                                              Constants.CLK_PATTERN_3, Constants.CLK_PATTERN_4)))
+_HEADER_RE = re.compile(Constants.HEADER_PATTERN.format('|'.join((
+    Constants.DATE_METADATA, Constants.WHITE_METADATA, Constants.WHITE_ELO_METADATA, Constants.BLACK_METADATA,
+    Constants.BLACK_ELO_METADATA, Constants.RESULT_METADATA, Constants.TIME_CONTROL_METADATA))))
+_HEADER_FIELDS = itemgetter(Constants.BLACK_METADATA, Constants.BLACK_ELO_METADATA, Constants.RESULT_METADATA,
+                            Constants.TIME_CONTROL_METADATA, Constants.WHITE_METADATA, Constants.WHITE_ELO_METADATA,
+                            Constants.DATE_METADATA)
+_RECORD_KEYS = (Constants.WIN_KEY, Constants.DRAW_KEY, Constants.LOSS_KEY)
+_RESULT_TO_COLUMN: dict[ChessResult, int] = {ChessResult.WIN: _RECORD_KEYS.index(Constants.WIN_KEY),
+                                             ChessResult.DRAW: _RECORD_KEYS.index(Constants.DRAW_KEY),
+                                             ChessResult.LOSS: _RECORD_KEYS.index(Constants.LOSS_KEY)}
 
 
 def _preProcessPGN(game_pgn: str, result: str) -> str:
@@ -30,7 +45,7 @@ def _preProcessPGN(game_pgn: str, result: str) -> str:
     game_pgn = _removeMoveNumbering(game_pgn)
 
     # All the game data in one line, so data will not get cut at the middle of line
-    game_pgn = re.sub(Constants.ONE_LINE_PATTERN, ' ', game_pgn)
+    game_pgn = ' '.join(game_pgn.split())
 
     # Converting the format of MOVE {[%clk TIME]} to MOVE TIME format(incase there is clk format in the pgn)
     game_pgn = _removeClockPattern(game_pgn)
@@ -39,22 +54,91 @@ def _preProcessPGN(game_pgn: str, result: str) -> str:
 
 
 def _removeMoveNumbering(game_pgn: str) -> str:
-    game_pgn = re.sub(Constants.BLACK_MOVE_NUMBER_PATTERN, '', game_pgn)
-    game_pgn = re.sub(Constants.WHITE_MOVE_NUMBER_PATTERN_NO_END_LINE, '', game_pgn)
-    game_pgn = re.sub(Constants.WHITE_MOVE_NUMBER_PATTERN_END_OF_LINE, '\n', game_pgn)
+    game_pgn = _BLACK_MOVE_NUMBER_RE.sub('', game_pgn)
+    game_pgn = _WHITE_MOVE_NUMBER_NO_END_LINE_RE.sub('', game_pgn)
+    game_pgn = _WHITE_MOVE_NUMBER_END_OF_LINE_RE.sub('\n', game_pgn)
     return game_pgn
 
 
+def _clockGroup(match: re.Match) -> str:
+    # Only the alternative that matched has a captured group, and it is always the last one captured.
+    return match.group(match.lastindex)
+
+
 def _removeClockPattern(game_pgn: str) -> str:
-    game_pgn = re.sub(Constants.CLK_PATTERN_1, Constants.CLK_PATTERN_GROUP, game_pgn)
-    game_pgn = re.sub(Constants.CLK_PATTERN_2, Constants.CLK_PATTERN_GROUP, game_pgn)
-    game_pgn = re.sub(Constants.CLK_PATTERN_3, Constants.CLK_PATTERN_GROUP, game_pgn)
-    game_pgn = re.sub(Constants.CLK_PATTERN_4, Constants.CLK_PATTERN_GROUP, game_pgn)
-    return game_pgn
+    return _CLK_RE.sub(_clockGroup, game_pgn)
+
+
+def _iterPgnGames(file: TextIO) -> Iterator[Tuple[str, str]]:
+    """
+    Streams the games of a PGN file one at a time instead of reading the whole file into memory.
+
+    Header lines are accumulated until the first blank line, then move lines until the next blank line, at which
+    point the game is emitted.
+
+    Args:
+        file (TextIO): The open PGN file.
+
+    Yields:
+        Tuple[str, str]: The metadata block and the moves block of each game.
+    """
+    metaData, moves = [], []
+    inMoves = False
+    for line in file:
+        if not line.strip():
+            if moves:
+                yield ''.join(metaData), ''.join(moves)
+                metaData, moves, inMoves = [], [], False
+            elif metaData:
+                inMoves = True
+            continue
+        (moves if inMoves else metaData).append(line)
+
+    if moves:
+        yield ''.join(metaData), ''.join(moves)
+
+
+def _joinFormatted(valueLists: list[list[float]]) -> list[str]:
+    """
+    Formats every value to two decimal places in one batch, joining each list's values with ';'.
+
+    Args:
+        valueLists (list[list[float]]): The lists of values to format.
+
+    Returns:
+        list[str]: The joined formatted values of each list.
+    """
+    formatted = np.char.mod(Constants.CSV_FLOAT_FORMAT, np.array([value for values in valueLists for value in values],
+                                                                 dtype=np.float64)).tolist()
+    bounds = np.cumsum([0] + [len(values) for values in valueLists]).tolist()
+    return [';'.join(formatted[start:end]) for start, end in zip(bounds, bounds[1:])]
+
+
+def _sortedTop(items: list, takeTop: int, sorting_key: Callable[[Any], Any], reverse: bool) -> list:
+    """
+    Sorts the items that can reach the first takeTop distinct sorting keys, skipping the rest when takeTop is small.
+
+    Args:
+        items (list): The items to sort.
+        takeTop (int): The number of distinct top keys that will be kept.
+        sorting_key (Callable[[Any], Any]): Function to extract the sorting key from an item.
+        reverse (bool): Whether to sort in reverse order.
+
+    Returns:
+        list: The sorted items, holding at least every item ranked within the first takeTop distinct keys.
+    """
+    if takeTop * Constants.PARTIAL_SORT_RATIO < len(items):
+        # Ties share a rank, so the cutoff is the takeTop-th distinct key rather than the takeTop-th item.
+        keys = [sorting_key(item) for item in items]
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        cutoff = select(takeTop, set(keys))[-1]
+        items = [item for item, key in zip(items, keys) if (key >= cutoff if reverse else key <= cutoff)]
+
+    return sorted(items, key=sorting_key, reverse=reverse)
 
 
 def _sortTop(openings: list[OpeningData], reverse: bool, attribute_func: Callable[[OpeningData], Any],
-             sorting_key: Callable[[Tuple[str, Any]], Any]) -> list[Tuple[str, Any]]:
+             sorting_key: Callable[[Tuple[str, Any]], Any], takeTop: int) -> list[Tuple[str, Any]]:
     """
     Sorts the given list of openings based on a specific attribute and sorting key.
 
@@ -63,16 +147,13 @@ def _sortTop(openings: list[OpeningData], reverse: bool, attribute_func: Callabl
         reverse (bool): Whether to sort in reverse order.
         attribute_func (Callable[[OpeningData], Any]): Function to extract the attribute to sort by from each opening.
         sorting_key (Callable[[Tuple[str, Any]], Any]): Function to extract the sorting key from the attribute.
+        takeTop (int): The number of top openings that will be taken from the result.
 
     Returns:
         list[Tuple[str, Any]]: Sorted list of tuples, each containing the opening name and the attribute value.
     """
-    topPicks = []
-    for opening in openings:  # openings types list[OpeningData]
-        topPicks.append((opening.getName(), attribute_func(opening)))
-
-    topPicks.sort(key=sorting_key, reverse=reverse)
-    return topPicks
+    topPicks = [(opening.getName(), attribute_func(opening)) for opening in openings]
+    return _sortedTop(topPicks, takeTop, sorting_key, reverse)
 
 
 def _checkMoveOverBound(openings: list[OpeningData], bound: int):
@@ -89,31 +170,45 @@ def _checkMoveOverBound(openings: list[OpeningData], bound: int):
     """
     longestMovePlayed = max((len(opening.getTotalTimesPlayedMove()) for opening in openings), default=0)
 
-    totalTimesPlayedMove: list[int] = _initTotalTimesPlayed(longestMovePlayed, openings)
-
-    for i, num in enumerate(totalTimesPlayedMove):
-        if num < bound:
-            return i
-    return longestMovePlayed
+    underBound = _initTotalTimesPlayed(longestMovePlayed, openings) < bound
+    return int(np.argmax(underBound)) if underBound.any() else longestMovePlayed
 
 
-def _initTotalTimesPlayed(longestMovePlayed: int, openings: list[OpeningData]) -> list[int]:
+def _initTotalTimesPlayed(longestMovePlayed: int, openings: list[OpeningData]) -> np.ndarray:
     """
-    Initializes a list of total times each move has been played across all openings.
+    Initializes an array of total times each move has been played across all openings.
 
     Args:
         longestMovePlayed (int): The length of the longest move sequence played.
         openings (list[OpeningData]): List of OpeningData instances to aggregate move counts from.
 
     Returns:
-        list[int]: List where each index represents the total times the corresponding move has been played.
+        np.ndarray: Array where each index represents the total times the corresponding move has been played.
     """
-    totalTimesPlayedMove: list[int] = [0] * longestMovePlayed
-    for opening in openings:
-        for idx, totalTimesPlayedMoveInOpening in enumerate(opening.getTotalTimesPlayedMove()):
-            totalTimesPlayedMove[idx] += totalTimesPlayedMoveInOpening
+    totalTimesPlayedMove, _ = _sumPerMove([opening.getTotalTimesPlayedMove() for opening in openings],
+                                          longestMovePlayed)
+    return totalTimesPlayedMove.astype(np.int64)
+
+
+def _sumPerMove(valueLists: list[list[float]], length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sums the values of every move index over all the lists, together with the number of lists reaching each move.
+
+    Args:
+        valueLists (list[list[float]]): Per-move values, one list per opening.
+        length (int): The number of moves to sum. Values past it are ignored.
 
-    return totalTimesPlayedMove
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The per-move sums and the per-move counts, both of the given length.
+    """
+    # The lists are laid out flat and each value is tagged with its move index, so one bincount sums them all.
+    lengths = np.fromiter((min(len(values), length) for values in valueLists), dtype=np.int64, count=len(valueLists))
+    flat = np.fromiter((value for values, size in zip(valueLists, lengths.tolist()) for value in values[:size]),
+                       dtype=np.float64, count=int(lengths.sum()))
+    starts = np.cumsum(lengths) - lengths
+    moveIndices = np.arange(flat.size) - np.repeat(starts, lengths)
+    return (np.bincount(moveIndices, weights=flat, minlength=length),
+            np.bincount(moveIndices, minlength=length))
 
 
 def _calculateAvgPerMove(openings: list[OpeningData], attributeFunc: Callable[[OpeningData], list[float]], bound: int) \
@@ -131,14 +226,9 @@ def _calculateAvgPerMove(openings: list[OpeningData], attributeFunc: Callable[[O
          value of the attribute for that move.
     """
     longestMoveOverBound: int = _checkMoveOverBound(openings, bound)
-    summed, counter = [0] * longestMoveOverBound, [0] * longestMoveOverBound
-
-    for opening in openings:
-        for i, val in enumerate(attributeFunc(opening)):
-            summed[i] += val
-            counter[i] += 1
-
-    avg_per_move = [(str(i), summed[i] / counter[i]) for i in range(longestMoveOverBound) if counter[i] != 0]
+    summed, counter = _sumPerMove([attributeFunc(opening) for opening in openings], longestMoveOverBound)
+    avg = summed / np.maximum(counter, 1)
+    avg_per_move = [(str(i), float(avg[i])) for i in np.flatnonzero(counter)]
     return avg_per_move
 
 
@@ -158,20 +248,32 @@ def _initResult(top_records: list[Tuple[str, Any]]):
     """
     result = {}
     for opening, value in top_records:
-        if isinstance(value, dict):
-            result[opening] = (
-                value.get(Constants.WIN_KEY),
-                value.get(Constants.DRAW_KEY),
-                value.get(Constants.LOSS_KEY))
+        handler = _RESULT_HANDLERS.get(type(value)) or _resultHandlerOf(value)
+        handler(opening, result, value)
+    return result
 
-        elif isinstance(value, list):
-            validateListType(opening, result, value)
 
-        elif isinstance(value, (float, int)):
-            result[opening] = value
-        else:
-            result[opening] = tuple(value, )
-    return result
+def _resultHandlerOf(value) -> Callable[[str, dict, Any], None]:
+    # Slow path for subclasses of the handled types (e.g. bool or NumPy scalars).
+    for valueType, handler in _RESULT_HANDLERS.items():
+        if isinstance(value, valueType):
+            return handler
+    return _initIterableResult
+
+
+def _initRecordResult(opening, result, value):
+    result[opening] = (
+        value.get(Constants.WIN_KEY),
+        value.get(Constants.DRAW_KEY),
+        value.get(Constants.LOSS_KEY))
+
+
+def _initScalarResult(opening, result, value):
+    result[opening] = value
+
+
+def _initIterableResult(opening, result, value):
+    result[opening] = tuple(value, )
 
 
 def validateListType(opening, result, value):
@@ -183,15 +285,18 @@ def validateListType(opening, result, value):
         result[opening] = tuple(val for val in value)
 
 
+_RESULT_HANDLERS: dict[type, Callable[[str, dict, Any], None]] = {dict: _initRecordResult, list: validateListType,
+                                                                  float: _initScalarResult, int: _initScalarResult}
+
+
 def _extractData(data) -> Tuple[str, int, str, str, str, int, str]:
-    date = _extractMetaData(data, Constants.DATE_METADATA)
-    white = _extractMetaData(data, Constants.WHITE_METADATA)
-    whiteElo = int(_extractMetaData(data, Constants.WHITE_ELO_METADATA))
-    black = _extractMetaData(data, Constants.BLACK_METADATA)
-    blackElo = int(_extractMetaData(data, Constants.BLACK_ELO_METADATA))
-    result = _extractMetaData(data, Constants.RESULT_METADATA)
-    time_control = _extractMetaData(data, Constants.TIME_CONTROL_METADATA)
-    return black, blackElo, result, time_control, white, whiteElo, date
+    # One scan over the header block collects every tag, and a prebuilt getter pulls out the ones we need.
+    black, blackElo, result, time_control, white, whiteElo, date = _HEADER_FIELDS(dict(_HEADER_RE.findall(data)))
+    return black, int(blackElo), result, time_control, white, int(whiteElo), date
+
+
+def _ngrams(text: str, size: int) -> set[str]:
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
 
 
 def _validateBound(argValue: int, minBound: int, errMsg: str) -> None:
@@ -199,6 +304,73 @@ def _validateBound(argValue: int, minBound: int, errMsg: str) -> None:
         raise ValueError(errMsg)
 
 
+def _bindInfo(method: Callable) -> Tuple[str, Tuple[str, ...], dict[str, Any]]:
+    """
+    Introspects a method once so its call arguments can later be bound without going through inspect.
+
+    Args:
+        method (Callable): The method to introspect.
+
+    Returns:
+        Tuple[str, Tuple[str, ...], dict[str, Any]]: The method's name, its parameter names after self (in order)
+         and the defaults of the parameters that have one.
+    """
+    parameters = list(inspect.signature(method).parameters.values())[1:]
+    return (method.__name__, tuple(parameter.name for parameter in parameters),
+            {parameter.name: parameter.default for parameter in parameters
+             if parameter.default is not inspect.Parameter.empty})
+
+
+def _freezeArg(argValue) -> Any:
+    if isinstance(argValue, (list, tuple)):
+        return tuple(_freezeArg(value) for value in argValue)
+    return argValue
+
+
+def _resultCacheKey(methodName: str, bound_param: dict[str, Any]) -> Union[Tuple[str, Tuple], type[None]]:
+    """
+    Builds the key a public method's result is cached under.
+
+    Args:
+        methodName (str): The name of the method.
+        bound_param (dict[str, Any]): The arguments of the call, defaults included.
+
+    Returns:
+        Union[Tuple[str, Tuple], type[None]]: The cache key, or None if the call should not be cached (it plots, or an
+         argument is unhashable).
+    """
+    if bound_param.get(Constants.PLOT_ARG):
+        return None
+    key = (methodName, tuple((argName, _freezeArg(argValue)) for argName, argValue in bound_param.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _cachedInLru(cache: OrderedDict, key: Any, build: Callable[[], Any]) -> Any:
+    """
+    Gets a value from a least-recently-used cache, building it on a miss and evicting the least recently used value
+    once the cache holds more than RESULT_CACHE_SIZE.
+
+    Args:
+        cache (OrderedDict): The cache, least recently used first.
+        key (Any): The key of the value.
+        build (Callable[[], Any]): Builds the value when it isn't cached.
+
+    Returns:
+        Any: The cached value.
+    """
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    value = cache[key] = build()
+    if len(cache) > Constants.RESULT_CACHE_SIZE:
+        cache.popitem(last=False)
+    return value
+
+
 def adjustAndValidateParams(method):
     """
     Decorator that adjusts and validates parameters for the given method.
@@ -212,16 +384,25 @@ def adjustAndValidateParams(method):
     Returns:
         Callable: The wrapped method with validated and updated parameters.
     """
+    bindInfo = _bindInfo(method)
+
     @wraps(method)
     def wrapper(self, *args, **kwargs):
-        bound_param = self._initBoundParam(method, args, kwargs)
+        bound_param = self._initBoundParam(bindInfo, args, kwargs)
+        cacheKey = _resultCacheKey(method.__name__, bound_param)
+        if cacheKey in self._resultCache:
+            return self._restoreCachedResult(cacheKey)
+
         self._clear()
         self._validateThenUpdateArgs(bound_param)
 
         self._validateClass()
 
         kwargs.update(bound_param)
-        return method(self, **kwargs)
+        result = method(self, **kwargs)
+        if cacheKey is not None:
+            self._cacheResult(cacheKey, result)
+        return result
 
     return wrapper
 
@@ -240,7 +421,7 @@ def _isAtrophiedGame(game_pgn: str, gameNum: int) -> bool:
      Returns:
          bool: True if the game is atrophied, False otherwise.
      """
-    if game_pgn.partition(Constants.WHITE_AND_BLACK_PLAYED_ONCE_FLAG)[1] != "":
+    if Constants.WHITE_AND_BLACK_PLAYED_ONCE_FLAG in game_pgn:
         return False
     print(Constants.ATROPHIED_GAME_MSG.format(str(gameNum)))
     return True
@@ -303,48 +484,74 @@ def _validateResult(result):
         raise ValueError(Constants.INVALID_RESULT_TYPE)
 
 
-def _findKeyInterval(result: dict, opponentElo: int) -> tuple[int, int]:
-    for key in result.keys():
-        if key[0] <= opponentElo <= key[1]:
-            return key
+def _findKeyInterval(opponentElos: np.ndarray, lowestElo: int, setGap: int, numOfIntervals: int) -> np.ndarray:
+    # Ranges are inclusive on both ends and the first matching one wins, so a rating on a shared boundary belongs to
+    # the lower range.
+    return np.clip((opponentElos - lowestElo - 1) // setGap, 0, numOfIntervals - 1)
 
 
 def _averagePoints(record: dict[str, int]) -> float:
-    total_games = record[Constants.WIN_KEY] + record[Constants.DRAW_KEY] + record[Constants.LOSS_KEY]
-    points = record[Constants.WIN_KEY] + Constants.DRAW_POINTS * record[Constants.DRAW_KEY]
+    return _averagePointsOfCounts(record[Constants.WIN_KEY], record[Constants.DRAW_KEY], record[Constants.LOSS_KEY])
+
+
+def _averagePointsOf(item: Tuple[str, tuple[int, int, int]]) -> float:
+    return _averagePointsOfCounts(*item[1])
+
+
+def _averageErrorOf(item: Tuple[str, float]) -> float:
+    return item[1]
+
+
+@lru_cache(maxsize=None)
+def _averagePointsOfCounts(wins: int, draws: int, losses: int) -> float:
+    total_games = wins + draws + losses
+    points = wins + Constants.DRAW_POINTS * draws
     return points / total_games if total_games > 0 else 0
 
 
-def _updateResult(result: dict, game: SingleGame) -> None:
-    key = _findKeyInterval(result, game.getOpponentElo())
-    if game.getGameResult() == ChessResult.WIN:
-        subKey = Constants.WIN_KEY
-    elif game.getGameResult() == ChessResult.LOSS:
-        subKey = Constants.LOSS_KEY
-    else:
-        subKey = Constants.DRAW_KEY
+def _updateResult(result: dict, keys: list[tuple[int, int]], lowestElo: int, setGap: int,
+                  games: list[SingleGame], opponentElos: np.ndarray) -> None:
+    """
+    Adds the results of the given games to the records of the Elo rating ranges their opponents fall in.
 
-    result[key][subKey] += 1
+    Args:
+        result (dict): The records by Elo rating range, as created by `_initEloDict`.
+        keys (list[tuple[int, int]]): The Elo rating ranges in ascending order.
+        lowestElo (int): The lowest Elo rating played.
+        setGap (int): The range gap for grouping Elo ratings.
+        games (list[SingleGame]): The games to count.
+        opponentElos (np.ndarray): The opponent Elo rating of each game.
+    """
+    columns = np.fromiter((_RESULT_TO_COLUMN[game.getGameResult()] for game in games), dtype=np.int64,
+                          count=len(games))
+    # Each (range, result) pair gets its own cell of a flat tally, so one bincount counts them all.
+    cells = _findKeyInterval(opponentElos, lowestElo, setGap, len(keys)) * len(_RECORD_KEYS) + columns
+    tally = np.bincount(cells, minlength=len(keys) * len(_RECORD_KEYS)).reshape(len(keys), len(_RECORD_KEYS))
+
+    for key, counts in zip(keys, tally.tolist()):
+        for recordKey, count in zip(_RECORD_KEYS, counts):
+            result[key][recordKey] += count
 
 
-def _initEloDict(openings: list[OpeningData], setGap: int) -> dict[tuple[int, int], dict[str, int]]:
+def _initEloDict(opponentElos: np.ndarray, setGap: int) \
+        -> Tuple[dict[tuple[int, int], dict[str, int]], list[tuple[int, int]], int]:
     """
     Initializes a dictionary to store the game results grouped by Elo rating ranges.
 
-    This function calculates the lowest and highest Elo ratings from the given openings.
+    This function calculates the lowest and highest Elo ratings played.
     It then creates ranges of Elo ratings with a specified gap and initializes a dictionary
     with these ranges as keys and dictionaries to store win, draw, and loss counts as values.
 
     Args:
-        openings (list[OpeningData]): A list of OpeningData objects containing game information.
+        opponentElos (np.ndarray): The opponent Elo rating of every game.
         setGap (int): The range gap for grouping Elo ratings.
 
     Returns:
-        dict[tuple[int, int], dict[str, int]]: A dictionary where keys are tuples representing
-        Elo rating ranges and values are dictionaries with keys for win, draw, and loss counts.
+        Tuple[dict[tuple[int, int], dict[str, int]], list[tuple[int, int]], int]: A dictionary where keys are tuples
+        representing Elo rating ranges and values are dictionaries with keys for win, draw, and loss counts, the list
+        of ranges in ascending order and the lowest Elo rating played.
     """
-    lowestEloPlayed = min(game.getOpponentElo() for opening in openings for game in opening.getGames())
-    maxEloPlayed = max(game.getOpponentElo() for opening in openings for game in opening.getGames())
+    lowestEloPlayed, maxEloPlayed = int(opponentElos.min()), int(opponentElos.max())
     left, right = lowestEloPlayed, lowestEloPlayed + setGap
 
     result = {}
@@ -359,28 +566,40 @@ def _initEloDict(openings: list[OpeningData], setGap: int) -> dict[tuple[int, in
                              Constants.DRAW_KEY: Constants.DEFAULT_DRAW_VAL,
                              Constants.LOSS_KEY: Constants.DEFAULT_LOSS_VAL}  # handles final iteration
 
-    return result
+    return result, list(result), lowestEloPlayed
 
 
 def _initGamesAgainstPlayer(gamesBound: int, openings: list[OpeningData]) -> list[Tuple[str, list[SingleGame]]]:
-    games = defaultdict(list)
+    games: dict[str, list[SingleGame]] = {}
     for opening in openings:
         for game in opening.getGames():
-            games[game.getOpponent()].append(game)
-    games = {opponentName: gamesAgainstOpponent for opponentName, gamesAgainstOpponent in games.items()
-             if len(gamesAgainstOpponent) >= gamesBound}
-    return [(key, val) for key, val in games.items()]
+            games.setdefault(game.getOpponent(), []).append(game)
+    return [(opponentName, gamesAgainstOpponent) for opponentName, gamesAgainstOpponent in games.items()
+            if len(gamesAgainstOpponent) >= gamesBound]
 
 
 def _initGamesFilteredTimeControl(gamesBound: int, openings: list[OpeningData]) -> list[Tuple[str, list[SingleGame]]]:
-    games = defaultdict(list)
+    games: dict[str, list[SingleGame]] = {}
     for opening in openings:
         for game in opening.getGames():
-            games[game.getTotalTimeControl()].append(game)
-    games = {timeControl: gamesAtTimeControl for timeControl, gamesAtTimeControl in games.items()
-             if len(gamesAtTimeControl) >= gamesBound}
+            games.setdefault(game.getTotalTimeControl(), []).append(game)
+    return [(timeControl, gamesAtTimeControl) for timeControl, gamesAtTimeControl in games.items()
+            if len(gamesAtTimeControl) >= gamesBound]
 
-    return [(key, val) for key, val in games.items()]
+
+def _takeTopRanks(sortedItems: list, takeTop: int, key: Callable[[Any], Any]) -> list:
+    """
+    Takes the items holding the first takeTop distinct values of an already sorted list, keeping tied items together.
+
+    Args:
+        sortedItems (list): The sorted items.
+        takeTop (int): The number of distinct values to take.
+        key (Callable[[Any], Any]): Function extracting the value the items are sorted by.
+
+    Returns:
+        list: The items holding the top values, in their sorted order.
+    """
+    return [item for _, tiedItems in islice(groupby(sortedItems, key=key), takeTop) for item in tiedItems]
 
 
 def _slicedTopRecords(topRecord: list[Tuple[Any, dict[str, int]]], takeTop: int) -> list[Tuple[Any, dict[str, int]]]:
@@ -394,14 +613,7 @@ def _slicedTopRecords(topRecord: list[Tuple[Any, dict[str, int]]], takeTop: int)
     Returns:
         list[Tuple[Any, dict[str, int]]]: The sliced top records.
     """
-    slicedItems = []
-    takeTopCounter = 0
-    topItemVal = _averagePoints(topRecord[0][1])
-    for tup in topRecord:
-        candidate = _averagePoints(tup[1])
-        parts = _updateSlicedItems(candidate, topItemVal, takeTopCounter, takeTop, slicedItems, tup)
-        topItemVal, takeTopCounter = parts[0], parts[1]
-    return slicedItems
+    return _takeTopRanks(topRecord, takeTop, lambda tup: _averagePoints(tup[1]))
 
 
 def _slicedTopItems(topItem: list[Tuple[str, float]], takeTop: int) -> list[Tuple[str, float]]:
@@ -415,72 +627,12 @@ def _slicedTopItems(topItem: list[Tuple[str, float]], takeTop: int) -> list[Tupl
     Returns:
         list[Tuple[str, float]]: The sliced top items.
     """
-    slicedItems = []
-    takeTopCounter = 0
-    topItemVal = topItem[0][1]
-    for tup in topItem:
-        candidate = tup[1]
-        parts = _updateSlicedItems(candidate, topItemVal, takeTopCounter, takeTop, slicedItems, tup)
-        topItemVal, takeTopCounter = parts[0], parts[1]
-    return slicedItems
-
-
-def _updateSlicedItems(candidate, topItemVal, takeTopCounter: int, takeTop: int,
-                       slicedItems: list[Tuple[Any, dict[str, int]]], tup):
-    """
-    Updates the sliced items list based on the candidate value and the top item value.
-
-    Args:
-        candidate: The candidate value to compare.
-        topItemVal: The current top item value.
-        takeTopCounter (int): The counter for the number of items taken.
-        takeTop (int): The number of top items to take.
-        slicedItems (list[Tuple[Any, dict[str, int]]]): The list of sliced items.
-        tup: The current tuple being processed.
-
-    Returns:
-        tuple: Updated top item value and take top counter.
-    """
-    if candidate < topItemVal and takeTopCounter >= takeTop:
-        return topItemVal, takeTopCounter
-    elif candidate < topItemVal and takeTopCounter < takeTop:
-        slicedItems.append((tup[0], tup[1]))
-        takeTopCounter += 1
-        topItemVal = candidate
-    else:
-        slicedItems.append((tup[0], tup[1]))
-    return topItemVal, takeTopCounter
-
-
-def _updateTopGamesList(candidate, topItemVal, takeTopCounter, takeTop, topGamesAgainstSpecificOpponent, game):
-    """
-    Updates the top games list based on the candidate value and the top item value.
-
-    Args:
-        candidate: The candidate value to compare.
-        topItemVal: The current top item value.
-        takeTopCounter: The counter for the number of items taken.
-        takeTop: The number of top items to take.
-        topGamesAgainstSpecificOpponent: The list of top games against a specific opponent.
-        game: The current game being processed.
-
-    Returns:
-        Updated top item value and take top counter.
-    """
-    if candidate < topItemVal and takeTopCounter >= takeTop:
-        return topItemVal
-    elif candidate < topItemVal and takeTopCounter < takeTop:
-        topGamesAgainstSpecificOpponent.append(game)
-        takeTopCounter += 1
-        topItemVal = candidate
-    else:
-        topGamesAgainstSpecificOpponent.append(game)
-    return topItemVal, takeTopCounter
+    return _takeTopRanks(topItem, takeTop, itemgetter(1))
 
 
 def _slicedTopSingleGames(sortedGames: list[Tuple[str, list[SingleGame]]], takeTop: int):
     """
-    Slices the top single games based on their errors until the takeTop limit is reached.
+    Slices the top single games of each group based on their errors until the takeTop limit is reached.
 
     Args:
         sortedGames (list[Tuple[str, list[SingleGame]]]): A list of tuples containing games.
@@ -489,31 +641,39 @@ def _slicedTopSingleGames(sortedGames: list[Tuple[str, list[SingleGame]]], takeT
     Returns:
         The sliced top single games.
     """
-    slicedItems = []
-    gameCounter = 0
-    topItemVal = sortedGames[0][1][0].getGameError()
-    for tup in sortedGames:
-        topGamesSpecificOpponent = []
-        for game in tup[1]:
-            candidate = game.getGameError()
-            parts = _updateTopGamesList(candidate, topItemVal, gameCounter, takeTop, topGamesSpecificOpponent, game)
-            topItemVal, gameCounter = parts[0], parts[1]
+    return [(name, _takeTopRanks(games, takeTop, lambda game: game.getGameError())) for name, games in sortedGames]
 
-        slicedItems.append((tup[0], topGamesSpecificOpponent))
-    return slicedItems
 
-
-def _updateResultGames(games: dict[str, list[SingleGame]], opening: OpeningData, gamesBound: int, ) -> None:
+def _updateResultGames(games: dict[ChessResult, list[SingleGame]], opening: OpeningData, gamesBound: int, ) -> None:
     if opening.getTotalGames() >= gamesBound:
         for game in opening.getGames():
-            games[ChessResult.chessResultToStr(game.getGameResult())].append(game)
+            games[game.getGameResult()].append(game)
 
 
-def _updateDateGames(games: dict[str, list[SingleGame]], opening: OpeningData, gamesBound: int, eloBound: int) -> None:
-    if opening.getTotalGames() >= gamesBound:
-        for game in opening.getGames():
-            if game.getOpponentElo() <= eloBound:
-                games[game.getDate().date().__str__()].append(game)
+def _initGamesByDate(gamesBound: int, eloBound: int, reverse: bool, openings: list[OpeningData]) \
+        -> list[Tuple[str, list[SingleGame]]]:
+    """
+    Groups the games by date, each group sorted by game error.
+
+    Args:
+        gamesBound (int): The minimum number of games an opening needs for its games to be included.
+        eloBound (int): The highest opponent Elo rating to include.
+        reverse (bool): Whether to sort each date's games by descending error.
+        openings (list[OpeningData]): The openings whose games are grouped.
+
+    Returns:
+        list[Tuple[str, list[SingleGame]]]: The dates (as 'yyyy-mm-dd') in ascending order, each with its sorted games.
+    """
+    games = [game for opening in openings if opening.getTotalGames() >= gamesBound
+             for game in opening.getGames() if game.getOpponentElo() <= eloBound]
+    dates = np.array([game.getDate() for game in games], dtype=Constants.GROUPING_DATE_DTYPE)
+    errors = np.fromiter((game.getGameError() for game in games), dtype=np.float64, count=len(games))
+
+    # One stable sort by (date, error) and a split at the first game of each date gives every group already sorted.
+    order = np.lexsort((-errors if reverse else errors, dates))
+    uniqueDates, starts = np.unique(dates[order], return_index=True)
+    groups = np.split(order, starts[1:])
+    return [(str(date), [games[i] for i in group]) for date, group in zip(uniqueDates, groups)]
 
 
 def _validateReverse(argValue):
@@ -535,6 +695,13 @@ def _validateThenUpdateTakeTop(argValue, bound_param):
     bound_param.update(takeTop=takeTop)
 
 
+_ARG_VALIDATORS: dict[str, Callable[[Any, dict], None]] = {
+    Constants.TAKE_TOP_ARG: _validateThenUpdateTakeTop,
+    Constants.REVERSE_ARG: lambda argValue, bound_param: _validateReverse(argValue),
+    Constants.PLOT_ARG: lambda argValue, bound_param: _validatePlotArg(argValue),
+    Constants.SET_GAP_ARG: lambda argValue, bound_param: _validateSetGap(argValue)}
+
+
 def _printAnalyzeProcess(i: int, numOfGamesToAnalyze: int) -> None:
     if numOfGamesToAnalyze > 0:
         print(Constants.PROCESS_ANALYZE_MSG.format(i + 1, numOfGamesToAnalyze))
@@ -556,15 +723,6 @@ def _calculateRecord(games: tuple[SingleGame, ...]) -> float:
     return avgRecord / len(games)
 
 
-def _checkIfMostCommon(opening, result, topScore):
-    if opening.getTotalGames() > topScore:
-        topScore = opening.getTotalGames()
-        result = [opening]
-    elif opening.getTotalGames() == topScore:
-        result.append(opening)
-    return topScore, result
-
-
 def _sanitizeResult(result):
     if len(result) == 0:
         return []
@@ -579,13 +737,15 @@ def _sliceAndPlot(games, plot, reverse, takeTop):
         game[1].sort(key=lambda item: item.getGameError(), reverse=reverse)
     slicedTop = _slicedTopSingleGames(games, takeTop)
     result = _initResult(slicedTop)
-    PlotFactory(result, plot, Constants.AGAINST_PLAYER_TITLE, Constants.AGAINST_PLAYER_X_LABEL,
-                Constants.AGAINST_PLAYER_Y_LABEL)
+    if plot:
+        PlotFactory(result, plot, Constants.AGAINST_PLAYER_TITLE, Constants.AGAINST_PLAYER_X_LABEL,
+                    Constants.AGAINST_PLAYER_Y_LABEL)
     return result
 
 
 class ChessAnalysis:
-    def __init__(self, dataset, username, stockfish: Stockfish) -> None:
+    def __init__(self, dataset, username, stockfish: Stockfish, workers: int = Constants.DEFAULT_WORKERS,
+                 stockfishPath: str = Constants.DEFAULT_STOCKFISH_PATH) -> None:
         """
         Initializes the ChessAnalysis class with the provided dataset, username, and Stockfish instance.
 
@@ -593,17 +753,28 @@ class ChessAnalysis:
             dataset: The path to the dataset (directory or file).
             username: The username of the player.
             stockfish (Stockfish): The Stockfish instance for chess analysis.
+            workers (int): The number of processes analyzing games in parallel, each with its own Stockfish engine
+                configured like `stockfish`. Defaults to 1 (analysis runs in this process).
+            stockfishPath (str): The path of the Stockfish executable `stockfish` runs, started by each worker.
+                Defaults to "stockfish".
 
         Raises:
             FileNotFoundError: If the dataset is neither a directory nor a file.
         """
-        self._allGames: set[SingleGame] = set()
-        self._gamesToAnalyze: set[SingleGame] = set()
+        self._allGames: list[SingleGame] = []
+        self._gamesToAnalyze: tuple[SingleGame, ...] = ()
         self._stockfish = stockfish
+        configureEngine(self._stockfish)
+        self._workers = workers
+        self._stockfishPath = stockfishPath
         self._username = username
         self._dataset = dataset
         self._moveStats = MoveStatistics()
         self._openingsStats: dict[str, OpeningData] = {}
+        self._openingNgramIndex: Union[dict[str, set[str]], type[None]] = None
+        self._mostCommonOpenings: list[OpeningData] = []
+        # The results of recent calls, least recently used first, holding at most RESULT_CACHE_SIZE entries.
+        self._resultCache: OrderedDict[Tuple[str, Tuple], Tuple[Any, Tuple]] = OrderedDict()
 
         if os.path.isdir(self._dataset):
             self._process_directory()
@@ -612,13 +783,164 @@ class ChessAnalysis:
         else:
             raise FileNotFoundError
 
+        self._initGameColumns()
+
+    def _initGameColumns(self) -> None:
+        """
+        Lays out the attributes the games are filtered by as arrays parallel to `self._allGames`. Opponents and results
+        are stored as integer codes.
+        """
+        games = self._allGames
+        self._gameDates = np.array([game.getDate() for game in games], dtype=Constants.GAME_DATE_DTYPE)
+        self._gameOpponentElos = np.fromiter((game.getOpponentElo() for game in games), dtype=np.int64,
+                                             count=len(games))
+        self._gameTimeControls = np.fromiter((game.getTimeControl() for game in games), dtype=np.int64,
+                                             count=len(games))
+        self._gameTimeBonuses = np.fromiter((game.getTimeBonus() for game in games), dtype=np.int64,
+                                            count=len(games))
+
+        self._opponentCodes: dict[str, int] = {}
+        for game in games:
+            self._opponentCodes.setdefault(game.getOpponent(), len(self._opponentCodes))
+        self._gameOpponentCodes = np.fromiter((self._opponentCodes[game.getOpponent()] for game in games),
+                                              dtype=np.int64, count=len(games))
+        self._gameResultColumns = np.fromiter((_RESULT_TO_COLUMN[game.getGameResult()] for game in games),
+                                              dtype=np.int64, count=len(games))
+
+        # Sorted views let the range criteria be resolved by binary search. Their masks are keyed by the cut position,
+        # so equivalent bounds share filtered games, but are cheap enough to rebuild rather than cache.
+        self._dateOrder = np.argsort(self._gameDates, kind='stable')
+        self._sortedGameDates = self._gameDates[self._dateOrder]
+        self._eloOrder = np.argsort(self._gameOpponentElos, kind='stable')
+        self._sortedOpponentElos = self._gameOpponentElos[self._eloOrder]
+        # The masks of recently used opponent, result and time control criteria, keyed by criterion and value.
+        self._criterionMasks: OrderedDict[Tuple[str, Any], np.ndarray] = OrderedDict()
+
+        # The opening of a game is only known once it is analyzed, so games join the opening index as they are filtered
+        self._gamesByOpening: dict[str, list[int]] = {}
+        self._openingIndexed = np.zeros(len(games), dtype=bool)
+        # The games selected by recent combinations of criteria, keyed by the criteria's mask keys and the openings.
+        self._filteredGames: OrderedDict[Tuple[Tuple[Tuple[str, Any], ...], Union[frozenset[str], None]],
+                                         tuple[SingleGame, ...]] = OrderedDict()
+
+    def _rankMask(self, criterion: str, order: np.ndarray, position: int, below: bool) \
+            -> Union[Tuple[Tuple[str, Any], np.ndarray], None]:
+        """
+        Builds the bit-packed mask of the games placed before (or from) a position of a sorted column.
+
+        Args:
+            criterion (str): The name of the criterion the mask is for.
+            order (np.ndarray): The game indices in the column's sorted order.
+            position (int): The cut position in the sorted column.
+            below (bool): Whether to keep the games before the position rather than from it.
+
+        Returns:
+            Union[Tuple[Tuple[str, Any], np.ndarray], None]: The criterion key and the mask over all games packed
+            eight games per byte, or None if the position keeps every game.
+        """
+        if position == (len(order) if below else 0):
+            return None
+        mask = np.zeros(len(order), dtype=bool)
+        mask[order[:position] if below else order[position:]] = True
+        return (criterion, position), np.packbits(mask)
+
+    def _opponentMask(self, opponent: frozenset[str]) -> Tuple[Tuple[str, Any], np.ndarray]:
+        key = (Constants.OPPONENT_ARG, opponent)
+        return key, _cachedInLru(self._criterionMasks, key, lambda: np.packbits(np.isin(
+            self._gameOpponentCodes, [self._opponentCodes[name] for name in opponent if name in self._opponentCodes])))
+
+    def _resultMask(self, result: frozenset[ChessResult]) -> Union[Tuple[Tuple[str, Any], np.ndarray], None]:
+        if len(result) == len(ChessResult):
+            return None
+        key = (Constants.RESULT_ARG, result)
+        return key, _cachedInLru(self._criterionMasks, key, lambda: np.packbits(np.isin(
+            self._gameResultColumns, [_RESULT_TO_COLUMN[r] for r in result])))
+
+    def _fromDateMask(self, fromDate) -> Union[Tuple[Tuple[str, Any], np.ndarray], None]:
+        position = int(np.searchsorted(self._sortedGameDates, np.datetime64(fromDate, Constants.GAME_DATE_UNIT),
+                                       side='left'))
+        return self._rankMask(Constants.FROM_DATE_ARG, self._dateOrder, position, below=False)
+
+    def _toDateMask(self, toDate) -> Union[Tuple[Tuple[str, Any], np.ndarray], None]:
+        position = int(np.searchsorted(self._sortedGameDates, np.datetime64(toDate, Constants.GAME_DATE_UNIT),
+                                       side='right'))
+        return self._rankMask(Constants.TO_DATE_ARG, self._dateOrder, position, below=True)
+
+    def _eloBoundMask(self, eloBound: int) -> Union[Tuple[Tuple[str, Any], np.ndarray], None]:
+        position = int(np.searchsorted(self._sortedOpponentElos, eloBound, side='right'))
+        return self._rankMask(Constants.ELO_BOUND_ARG, self._eloOrder, position, below=True)
+
+    def _timeControlMask(self, timeControl: Tuple[int, int]) -> Tuple[Tuple[str, Any], np.ndarray]:
+        key = (Constants.TIME_CONTROL_ARG, timeControl)
+        return key, _cachedInLru(self._criterionMasks, key, lambda: np.packbits(
+            (self._gameTimeControls == timeControl[0]) & (self._gameTimeBonuses == timeControl[1])))
+
+    def _openingMask(self, openings: frozenset[str], candidates: np.ndarray) -> np.ndarray:
+        """
+        Gets the mask of the games played in any of the given openings, indexing the candidate games not indexed yet.
+
+        Args:
+            openings (frozenset[str]): The opening names (main or with variation) to keep.
+            candidates (np.ndarray): The indices of the games that may be kept. Only these are analyzed if needed.
+
+        Returns:
+            np.ndarray: The boolean mask over all games, valid for the candidate games.
+        """
+        for i in candidates[~self._openingIndexed[candidates]].tolist():
+            game = self._allGames[i]
+            name, mainOpening = game.getName(), game.getMainOpening()
+            self._gamesByOpening.setdefault(name, []).append(i)
+            if mainOpening != name:
+                self._gamesByOpening.setdefault(mainOpening, []).append(i)
+            self._openingIndexed[i] = True
+
+        mask = np.zeros(len(self._allGames), dtype=bool)
+        for opening in openings:
+            mask[self._gamesByOpening.get(opening, [])] = True
+        return mask
+
     def _clear(self) -> None:
         """
         Clears the internal data structures.
+
+        Fresh objects are bound rather than clearing the current ones in place, since the current ones may be part of
+        a cached result's state.
         """
-        self._openingsStats.clear()
-        self._gamesToAnalyze.clear()
-        self._moveStats.clear()
+        self._openingsStats = {}
+        self._openingNgramIndex = None
+        self._gamesToAnalyze = ()
+        self._moveStats = MoveStatistics()
+        self._mostCommonOpenings = []
+
+    def _cacheResult(self, cacheKey: Tuple[str, Tuple], result: Any) -> None:
+        """
+        Caches a public method's result together with the state the call left behind, evicting the least recently
+        used result once the cache is full.
+
+        Args:
+            cacheKey (Tuple[str, Tuple]): The key of the call, see `_resultCacheKey`.
+            result (Any): The result of the call.
+        """
+        self._resultCache[cacheKey] = (copy(result), (self._openingsStats, self._openingNgramIndex,
+                                                      self._gamesToAnalyze, self._moveStats, self._mostCommonOpenings))
+        if len(self._resultCache) > Constants.RESULT_CACHE_SIZE:
+            self._resultCache.popitem(last=False)
+
+    def _restoreCachedResult(self, cacheKey: Tuple[str, Tuple]) -> Any:
+        """
+        Restores the state a cached call left behind and returns a copy of its result.
+
+        Args:
+            cacheKey (Tuple[str, Tuple]): The key of the call, see `_resultCacheKey`.
+
+        Returns:
+            Any: A copy of the cached result.
+        """
+        self._resultCache.move_to_end(cacheKey)
+        result, state = self._resultCache[cacheKey]
+        (self._openingsStats, self._openingNgramIndex, self._gamesToAnalyze, self._moveStats,
+         self._mostCommonOpenings) = state
+        return copy(result)
 
     def _validateOpeningNames(self, openings: list[str]) -> None:
         """
@@ -658,13 +980,33 @@ class ChessAnalysis:
         Raises:
             ValueError: If no similar openings are found.
         """
-        similar_openings = [o for o in self._openingsStats if opening in o]
+        ngrams = _ngrams(opening, Constants.OPENING_NGRAM_SIZE)
+        if ngrams:
+            index = self._getOpeningNgramIndex()
+            candidates = set.intersection(*(index.get(ngram, set()) for ngram in ngrams))
+        else:  # Too short to have an n-gram, every opening is a candidate.
+            candidates = self._openingsStats.keys()
+        similar_openings = sorted(o for o in candidates if opening in o)
         if similar_openings:
             similar_openings_str = ", ".join(similar_openings)
             raise ValueError(Constants.NO_OPENING_BUT_THERE_IS_SIMILAR_ERR.format(similar_openings_str))
         else:
             raise ValueError(Constants.NO_OPENING_ERR.format(opening))
 
+    def _getOpeningNgramIndex(self) -> dict[str, set[str]]:
+        """
+        Gets the index from every n-gram of the opening names to the names containing it, building it on first use.
+
+        Returns:
+            dict[str, set[str]]: The n-gram index of the opening names.
+        """
+        if self._openingNgramIndex is None:
+            self._openingNgramIndex = {}
+            for name in self._openingsStats:
+                for ngram in _ngrams(name, Constants.OPENING_NGRAM_SIZE):
+                    self._openingNgramIndex.setdefault(ngram, set()).add(name)
+        return self._openingNgramIndex
+
     def _process_directory(self) -> None:
         """
         Processes all PGN files in the provided directory.
@@ -675,7 +1017,7 @@ class ChessAnalysis:
                 noPgnFound = False
                 file_path = os.path.join(self._dataset, file_name)
                 with open(file_path, 'r') as f:
-                    self._processPgnFile(f.read())
+                    self._processPgnFile(f)
         if noPgnFound:
             raise ValueError(Constants.NO_PGN_FILES_ERR)
 
@@ -686,25 +1028,22 @@ class ChessAnalysis:
         if not self._dataset.endswith(Constants.VALID_GAME_EXTENSION):
             raise ValueError(Constants.FILE_NOT_PGN_ERR)
         with open(self._dataset, 'r') as f:
-            self._processPgnFile(f.read())
+            self._processPgnFile(f)
 
-    def _processPgnFile(self, file: str) -> None:
+    def _processPgnFile(self, file: TextIO) -> None:
         """
-        Processes the content of a PGN file, extracting game data and metadata.
+        Processes a PGN file game by game, extracting game data and metadata.
 
         Args:
-            file (str): The content of the PGN file.
+            file (TextIO): The open PGN file.
         """
-        file_data = file.split(Constants.PGN_META_DATA_TO_GAME_SEPERATOR)
-        # Even numbers := the metadata of the next odd number game. Odd := the actual game moves.
-        for i in range(0, len(file_data), 2):
-            metaData, game = file_data[i], file_data[i + 1]
+        for gameNum, (metaData, game) in enumerate(_iterPgnGames(file), start=1):
             black, blackElo, result, time_control, white, whiteElo, date = _extractData(metaData)
 
             if white != self._username and black != self._username:
                 raise ValueError(Constants.USERNAME_NOT_MATCH_ERR)
 
-            if _isAtrophiedGame(game, int((i / 2) + 1)):
+            if _isAtrophiedGame(game, gameNum):
                 continue
 
             pgn = _preProcessPGN(game, result)
@@ -713,7 +1052,7 @@ class ChessAnalysis:
             opponent = black if self._username == white else white
 
             game = SingleGame(pgn, whiteElo, blackElo, result, time_control, userColor, self._stockfish, opponent, date)
-            self._allGames.add(game)
+            self._allGames.append(game)
 
     def _initOpening(self) -> list[OpeningData]:
         """
@@ -722,12 +1061,9 @@ class ChessAnalysis:
         Returns:
             list[OpeningData]: The list of initialized openings.
         """
-        numOfGameToAnalyze = sum(1 for game in self._gamesToAnalyze if not game.isAnalyzed())
-        for i, game in enumerate(self._gamesToAnalyze):
-            _printAnalyzeProcess(i, numOfGameToAnalyze)
-
-            game.analyzeGame()
+        self._analyzeGames([game for game in self._gamesToAnalyze if not game.isAnalyzed()])
 
+        for game in self._gamesToAnalyze:
             self._moveStats.update(game)
             opening, variation = game.getMainOpening(), game.getVariation()
 
@@ -736,68 +1072,105 @@ class ChessAnalysis:
         sanitizedOpenings: list[OpeningData] = [opening for opening in self._openingsStats.values()]
         return sanitizedOpenings
 
-    def _updateOpening(self, game, opening, variation):
-        self._updateMainOpening(opening, game)
-        if variation is not None:
-            self._updateVariation(opening, game.getName(), game)
-
-    def _filterOpponents(self, filteredOpponents: set[SingleGame], opponent: list[str]) -> None:
+    def _analyzeGames(self, games: list[SingleGame]) -> None:
         """
-        Filters opponents based on the provided list.
+        Runs the Stockfish analysis of the given games, spreading it over a process pool when more than one worker
+        is configured.
 
         Args:
-            filteredOpponents (set[SingleGame]): The set to store filtered opponents.
-            opponent (list[str]): The list of opponent names to filter by.
+            games (list[SingleGame]): The games that still need to be analyzed.
         """
-        for game in self._allGames:
-            if game.getOpponent() in opponent:
-                filteredOpponents.add(game)
+        for i, _ in enumerate(SingleGame.analyzeGames(games, self._workers, self._stockfishPath)):
+            _printAnalyzeProcess(i, len(games))
 
-    def _filterResults(self, filteredResults: set[SingleGame], result: Tuple[ChessResult, ...]) -> None:
-        """
-        Filters results based on the provided tuple of results.
-
-        Args:
-            filteredResults (set[SingleGame]): The set to store filtered results.
-            result (Tuple[ChessResult, ...]): The tuple of results to filter by.
-        """
-        for game in self._allGames:
-            if game.getGameResult() in result:
-                filteredResults.add(game)
+    def _updateOpening(self, game, opening, variation):
+        self._updateMainOpening(opening, game)
+        if variation is not None:
+            self._updateVariation(opening, game.getName(), game)
+        updateMostCommon(self._mostCommonOpenings, self._openingsStats[opening], self._openingsStats)
 
-    def _filterOpenings(self, filteredOpenings: set[SingleGame], openings: Union[list[str], type[None]]) -> None:
+    def _filterGames(self, opponent: Union[frozenset[str], type[None]] = None,
+                     result: Union[frozenset[ChessResult], type[None]] = None,
+                     openings: Union[frozenset[str], type[None]] = None, fromDate=None, toDate=None,
+                     eloBound: Union[int, type[None]] = None,
+                     timeControl: Union[Tuple[int, int], type[None]] = None) -> tuple[SingleGame, ...]:
         """
-        Filters openings based on the provided list.
+        Filters all games by every given criterion. Criteria left as None are not applied.
 
         Args:
-            filteredOpenings (set[SingleGame]): The set to store filtered openings.
-            openings (Union[list[str], type[None]]): The list of opening names to filter by.
-        """
-        if openings is None:
-            filteredOpenings.update(self._allGames)
-            return
-        for game in self._allGames:
-            if game.getName() in openings or game.getMainOpening() in openings:
-                filteredOpenings.add(game)
+            opponent (frozenset[str], optional): The opponent names to keep.
+            result (frozenset[ChessResult], optional): The results to keep.
+            openings (frozenset[str], optional): The opening names (main or with variation) to keep.
+            fromDate (datetime, optional): The earliest date to keep.
+            toDate (datetime, optional): The latest date to keep.
+            eloBound (int, optional): The highest opponent Elo rating to keep.
+            timeControl (Tuple[int, int], optional): The main time control and bonus time to keep.
 
-    def _initBoundParam(self, method, args, kwargs) -> dict[str, Any]:
+        Returns:
+            tuple[SingleGame, ...]: The games meeting all the criteria, in the order they were read. The same tuple is
+            returned for every combination of criteria selecting the same masks.
+        """
+        # Every criterion known from the game columns becomes a bit-packed membership mask, and the masks are combined
+        # at once by a bytewise AND covering eight games per byte.
+        # Criteria keeping every game (as the defaults usually do) have no mask, so they cost nothing to combine.
+        # The opening is only known once a game is analyzed, so it is checked last and only on the remaining games.
+        keyedMasks = [keyedMask for keyedMask in
+                      (criterionMask(value) for criterionMask, value in
+                       ((self._opponentMask, opponent), (self._resultMask, result), (self._fromDateMask, fromDate),
+                        (self._toDateMask, toDate), (self._eloBoundMask, eloBound),
+                        (self._timeControlMask, timeControl))
+                       if value is not None)
+                      if keyedMask is not None]
+        masks = [mask for _, mask in keyedMasks]
+
+        def filterGames() -> tuple[SingleGame, ...]:
+            if not masks and openings is None:
+                return tuple(self._allGames)
+            mask = (np.unpackbits(np.bitwise_and.reduce(masks), count=len(self._allGames)).astype(bool) if masks
+                    else np.ones(len(self._allGames), dtype=bool))
+            if openings is not None:
+                mask = mask & self._openingMask(openings, np.flatnonzero(mask))
+            return tuple(self._allGames[i] for i in np.flatnonzero(mask))
+
+        # The criteria's mask keys name the combination of criteria by value.
+        return _cachedInLru(self._filteredGames, (tuple(key for key, _ in keyedMasks), openings), filterGames)
+
+    def _initBoundParam(self, bindInfo: Tuple[str, Tuple[str, ...], dict[str, Any]], args, kwargs) \
+            -> dict[str, Any]:
         """
         Initializes bound parameters for the provided method and arguments.
 
         Args:
-            method: The method to bind parameters to.
+            bindInfo (Tuple[str, Tuple[str, ...], dict[str, Any]]): The method's binding info, see `_bindInfo`.
             args: The positional arguments.
             kwargs: The keyword arguments.
 
         Returns:
-            dict[str, Any]: The bound parameters.
-        """
-        signature = inspect.signature(method)
-        bound_arguments = signature.bind(self, *args, **kwargs)
-        bound_arguments.apply_defaults()
-        bound_param = bound_arguments.arguments
+            dict[str, Any]: The bound parameters, in the method's parameter order.
 
-        bound_param.pop(Constants.REMOVE_DUPLICATE)
+        Raises:
+            TypeError: If the arguments do not match the method's parameters.
+        """
+        methodName, paramNames, defaults = bindInfo
+        if len(args) > len(paramNames):
+            raise TypeError(Constants.TOO_MANY_ARGUMENTS_ERR.format(methodName, len(paramNames), len(args)))
+
+        supplied = dict(zip(paramNames, args))
+        for argName, argValue in kwargs.items():
+            if argName not in paramNames:
+                raise TypeError(Constants.UNEXPECTED_ARGUMENT_ERR.format(methodName, argName))
+            if argName in supplied:
+                raise TypeError(Constants.MULTIPLE_VALUES_ERR.format(methodName, argName))
+            supplied[argName] = argValue
+
+        bound_param = {}
+        for paramName in paramNames:
+            if paramName in supplied:
+                bound_param[paramName] = supplied[paramName]
+            elif paramName in defaults:
+                bound_param[paramName] = defaults[paramName]
+            else:
+                raise TypeError(Constants.MISSING_ARGUMENT_ERR.format(methodName, paramName))
         return bound_param
 
     def _updateMainOpening(self, opening: str, game: SingleGame) -> None:
@@ -819,90 +1192,60 @@ class ChessAnalysis:
         Args:
             bound_param: The bound parameters.
         """
-        filteredToDate, filteredFromDate, filteredOpponents, filteredResult, filteredEloBound, filteredOpenings, \
-            filteredTimeControl = \
-            (set(), set(), set(), set(), set(), set(), set())
-        presentArgs: list[set] = []
+        filters: dict[str, Any] = {}
 
         for argName, argValue in bound_param.items():
-            if argName == Constants.OPENINGS_ARG:
-                self._filterOpenings(filteredOpenings, argValue)
-                presentArgs.append(filteredOpenings)
-
-            if argName == Constants.OPPONENT_ARG:
-                self._validateThenUpdateOpponents(argValue, bound_param, filteredOpponents)
-                presentArgs.append(filteredOpponents)
-
-            if argName == Constants.RESULT_ARG:
-                self._validateThenUpdateResult(argValue, bound_param, filteredResult)
-                presentArgs.append(filteredResult)
-
-            if argName == Constants.FROM_DATE_ARG:
-                self._validateThenUpdateFromDate(argValue, bound_param, filteredFromDate)
-                presentArgs.append(filteredFromDate)
-
-            if argName == Constants.TO_DATE_ARG:
-                self._validateThenUpdateToDate(argValue, bound_param, filteredToDate)
-                presentArgs.append(filteredToDate)
-
-            if argName == Constants.ELO_BOUND_ARG:
-                self._validateThenUpdateEloBound(argValue, filteredEloBound)
-                presentArgs.append(filteredEloBound)
-
-            if argName == Constants.TIME_CONTROL_ARG:
-                self._validateThenUpdateTimeControl(argValue, filteredTimeControl)
-                presentArgs.append(filteredTimeControl)
-
-            if argName == Constants.TAKE_TOP_ARG:
-                _validateThenUpdateTakeTop(argValue, bound_param)
-
-            if argName == Constants.REVERSE_ARG:
-                _validateReverse(argValue)
+            if argName in self._FILTER_HANDLERS:
+                filters[argName] = self._FILTER_HANDLERS[argName](self, argValue, bound_param)
+            elif argName in _ARG_VALIDATORS:
+                _ARG_VALIDATORS[argName](argValue, bound_param)
 
-            if argName == Constants.PLOT_ARG:
-                _validatePlotArg(argValue)
-
-            if argName == Constants.SET_GAP_ARG:
-                _validateSetGap(argValue)
-
-        self._gamesToAnalyze = set.intersection(*presentArgs)
+        self._gamesToAnalyze = self._filterGames(**filters)
         openings = self._initOpening()
         bound_param.update(openings=openings)
 
-    def _validateThenUpdateOpponents(self, argValue, bound_param, filteredOpponents):
+    def _validateThenUpdateOpenings(self, argValue, bound_param) -> Union[frozenset[str], None]:
+        if argValue is None:
+            return None
+        return frozenset((argValue,)) if isinstance(argValue, str) else frozenset(argValue)
+
+    def _validateThenUpdateOpponents(self, argValue, bound_param) -> Union[frozenset[str], None]:
         _validateOpponent(argValue)
-        opponent = self._getAllOpponents() if argValue is None else argValue
-        self._filterOpponents(filteredOpponents, opponent)
-        bound_param.update(opponent=opponent)
+        if argValue is None:
+            bound_param.update(opponent=self._getAllOpponents())
+            return None
+        bound_param.update(opponent=argValue)
+        return frozenset((argValue,)) if isinstance(argValue, str) else frozenset(argValue)
 
-    def _validateThenUpdateToDate(self, argValue, bound_param, toDateSet: set) -> None:
+    def _validateThenUpdateToDate(self, argValue, bound_param):
         toDate = parseDate(argValue)
-        toDateSet.update(game for game in self._allGames if game.getDate() <= toDate)
         bound_param.update(toDate=toDate)
+        return toDate
 
-    def _validateThenUpdateFromDate(self, argValue, bound_param, fromDateSet: set) -> None:
+    def _validateThenUpdateFromDate(self, argValue, bound_param):
         fromDate = parseDate(argValue)
-        fromDateSet.update(game for game in self._allGames if game.getDate() >= fromDate)
         bound_param.update(fromDate=fromDate)
+        return fromDate
 
-    def _validateThenUpdateResult(self, argValue, bound_param, games):
+    def _validateThenUpdateResult(self, argValue, bound_param) -> frozenset[ChessResult]:
         _validateResult(argValue)
         result = ChessResult.numToChessResult(argValue)
-        self._filterResults(games, result)
         bound_param.update(result=result)
+        return frozenset(result)
 
-    def _validateThenUpdateEloBound(self, argValue, filteredEloBound):
+    def _validateThenUpdateEloBound(self, argValue, bound_param) -> int:
         _validateEloBound(argValue)
-        filteredEloBound.update(game for game in self._allGames if game.getOpponentElo() <= argValue)
+        return argValue
 
-    def _validateThenUpdateTimeControl(self, argValue, filteredTimeControl: set) -> None:
-        if argValue is None:
-            filteredTimeControl.update(game for game in self._allGames)
-        else:
-            timeControl, bonusTime = extractTimeControl(argValue)
-            for game in self._allGames:
-                if game.getTimeControl() == timeControl and game.getTimeBonus() == bonusTime:
-                    filteredTimeControl.add(game)
+    def _validateThenUpdateTimeControl(self, argValue, bound_param) -> Union[Tuple[int, int], None]:
+        return None if argValue is None else extractTimeControl(argValue)
+
+    # Each filtering argument's handler validates it and returns the criterion passed on to `_filterGames`
+    _FILTER_HANDLERS: dict[str, Callable[[Any, Any, dict], Any]] = {
+        Constants.OPENINGS_ARG: _validateThenUpdateOpenings, Constants.OPPONENT_ARG: _validateThenUpdateOpponents,
+        Constants.RESULT_ARG: _validateThenUpdateResult, Constants.FROM_DATE_ARG: _validateThenUpdateFromDate,
+        Constants.TO_DATE_ARG: _validateThenUpdateToDate, Constants.ELO_BOUND_ARG: _validateThenUpdateEloBound,
+        Constants.TIME_CONTROL_ARG: _validateThenUpdateTimeControl}
 
     def _updateVariation(self, opening: str, variation: str, game: SingleGame) -> None:
         self._openingsStats[opening].addVariation(game, variation)
@@ -924,23 +1267,19 @@ class ChessAnalysis:
             self._validateOpeningNames([openings])
             return self._openingsStats[openings]
 
-    def _getMostCommon(self, openings: list[OpeningData] = None) -> Union[OpeningData, Tuple[OpeningData, ...], list]:
+    def _getMostCommon(self, mostCommon: list[OpeningData] = None) \
+            -> Union[OpeningData, Tuple[OpeningData, ...], list]:
         """
         Gets the most common opening(s) based on the number of games.
 
         Args:
-            openings (list[OpeningData], optional): The list of openings to consider. Defaults to None.
+            mostCommon (list[OpeningData], optional): The openings tied for the most games, as tracked while adding
+                games. Defaults to None (the tracked main openings).
 
         Returns:
             Union[OpeningData, Tuple[OpeningData, ...], list]: The most common opening(s).
         """
-        topScore = 0
-        result = []
-        openings = list(self._openingsStats.values()) if openings is None else openings
-        for opening in openings:
-            topScore, result = _checkIfMostCommon(opening, result, topScore)
-
-        return _sanitizeResult(result)
+        return _sanitizeResult(self._mostCommonOpenings if mostCommon is None else mostCommon)
 
     def _getAllOpponents(self) -> list[str]:
         """
@@ -949,10 +1288,7 @@ class ChessAnalysis:
         Returns:
             list[str]: The list of opponent names.
         """
-        opponents = set()
-        for game in self._allGames:
-            opponents.add(game.getOpponent())
-        return list(opponents)
+        return list(self._opponentCodes)
 
     def getOpenings(self) -> dict[str, OpeningData]:
         """
@@ -990,12 +1326,13 @@ class ChessAnalysis:
         attributeFunc = lambda opening: opening.getErrorPerMove()
         avgErrorPerMove = _calculateAvgPerMove(openings, attributeFunc, moveBound)
 
-        avgErrorPerMove.sort(key=lambda x: -x[1], reverse=reverse)
-        slicedTop = _slicedTopItems(avgErrorPerMove, takeTop)
+        topError = _sortedTop(avgErrorPerMove, takeTop, lambda x: -x[1], reverse)
+        slicedTop = _slicedTopItems(topError, takeTop)
         result = _initResult(slicedTop)
 
-        PlotFactory(result, plot, Constants.ERROR_PER_MOVE_TITLE, Constants.ERROR_PER_MOVE_X_LABEL,
-                    Constants.ERROR_PER_MOVE_Y_LABEL)
+        if plot:
+            PlotFactory(result, plot, Constants.ERROR_PER_MOVE_TITLE, Constants.ERROR_PER_MOVE_X_LABEL,
+                        Constants.ERROR_PER_MOVE_Y_LABEL)
 
         return result
 
@@ -1027,11 +1364,13 @@ class ChessAnalysis:
         _removeGamesUnderBound(gamesBound, openings)
 
         attributeFunc, sortingKey = lambda opening: opening.getOpeningAvgError(), lambda x: -x[1]
-        topError = _sortTop(openings, reverse, attributeFunc, sortingKey)
+        topError = _sortTop(openings, reverse, attributeFunc, sortingKey, takeTop)
         slicedTop = _slicedTopItems(topError, takeTop)
         result = _initResult(slicedTop)
 
-        PlotFactory(result, plot, Constants.AVG_ERROR_TITLE, Constants.AVG_ERROR_X_LABEL, Constants.AVG_ERROR_Y_LABEL)
+        if plot:
+            PlotFactory(result, plot, Constants.AVG_ERROR_TITLE, Constants.AVG_ERROR_X_LABEL,
+                        Constants.AVG_ERROR_Y_LABEL)
 
         return result
 
@@ -1061,12 +1400,13 @@ class ChessAnalysis:
         attribute_func = lambda opening: opening.getTimeSpent()
         avgTimePerMove = _calculateAvgPerMove(openings, attribute_func, moveBound)
 
-        topTime = sorted(avgTimePerMove, key=lambda x: -x[1], reverse=reverse)
+        topTime = _sortedTop(avgTimePerMove, takeTop, lambda x: -x[1], reverse)
         slicedTop = _slicedTopItems(topTime, takeTop)
         result = _initResult(slicedTop)
 
-        PlotFactory(result, plot, Constants.TIME_SPENT_TITLE, Constants.TIME_SPENT_X_LABEL,
-                    Constants.TIME_SPENT_Y_LABEL)
+        if plot:
+            PlotFactory(result, plot, Constants.TIME_SPENT_TITLE, Constants.TIME_SPENT_X_LABEL,
+                        Constants.TIME_SPENT_Y_LABEL)
 
         return result
 
@@ -1096,12 +1436,13 @@ class ChessAnalysis:
         _removeGamesUnderBound(gamesBound, openings)
 
         attributeFunc, sortingKey = lambda opening: opening.getRecord(), lambda x: _averagePoints(x[1])
-        topRecords = _sortTop(openings, reverse, attributeFunc, sortingKey)
+        topRecords = _sortTop(openings, reverse, attributeFunc, sortingKey, takeTop)
         topSlicedRecords = _slicedTopRecords(topRecords, takeTop)
 
         result = _initResult(topSlicedRecords)
 
-        PlotFactory(result, plot, Constants.RECORD_TITLE, Constants.RECORD_X_LABEL, Constants.RECORD_Y_LABEL)
+        if plot:
+            PlotFactory(result, plot, Constants.RECORD_TITLE, Constants.RECORD_X_LABEL, Constants.RECORD_Y_LABEL)
 
         return result
 
@@ -1132,13 +1473,14 @@ class ChessAnalysis:
         _removeGamesUnderBound(gamesBound, openings)
 
         attributeFunc, sortingKey = lambda opening: opening.getAvgMoveLeavingOpening(), lambda x: -x[1]
-        topAvgMove = _sortTop(openings, reverse, attributeFunc, sortingKey)
+        topAvgMove = _sortTop(openings, reverse, attributeFunc, sortingKey, takeTop)
         slicedTop = _slicedTopItems(topAvgMove, takeTop)
 
         result = _initResult(slicedTop)
 
-        PlotFactory(result, plot, Constants.LEAVING_OPENING_TITLE, Constants.LEAVING_OPENING_X_LABEL,
-                    Constants.LEAVING_OPENING_Y_LABEL)
+        if plot:
+            PlotFactory(result, plot, Constants.LEAVING_OPENING_TITLE, Constants.LEAVING_OPENING_X_LABEL,
+                        Constants.LEAVING_OPENING_Y_LABEL)
 
         return result
 
@@ -1169,11 +1511,11 @@ class ChessAnalysis:
         Returns:
             dict[tuple[int, int], [tuple[int, int, int]]]: The record (wins, draws, losses) by Elo rating range for the given openings.
         """
-        result = _initEloDict(openings, setGap)
+        games = [game for opening in openings for game in opening.getGames()]
+        opponentElos = np.fromiter((game.getOpponentElo() for game in games), dtype=np.int64, count=len(games))
 
-        for opening in openings:
-            for game in opening.getGames():
-                _updateResult(result, game)
+        result, keys, lowestElo = _initEloDict(opponentElos, setGap)
+        _updateResult(result, keys, lowestElo, setGap, games, opponentElos)
 
         sorted_items = sorted(result.items(), key=lambda item: _averagePoints(item[1]), reverse=reverse)
         sorted_items = [(elo, record) for elo, record in sorted_items if _totalGames(record) >= gamesBound]
@@ -1181,8 +1523,9 @@ class ChessAnalysis:
         result = {key: (value[Constants.WIN_KEY], value[Constants.DRAW_KEY], value[Constants.LOSS_KEY])
                   for key, value in sorted_items}
 
-        PlotFactory(result, plot, Constants.RESULT_BY_ELO_TITLE, Constants.RESULT_BY_ELO_X_LABEL,
-                    Constants.RESULT_BY_ELO_Y_LABEL)
+        if plot:
+            PlotFactory(result, plot, Constants.RESULT_BY_ELO_TITLE, Constants.RESULT_BY_ELO_X_LABEL,
+                        Constants.RESULT_BY_ELO_Y_LABEL)
 
         return result
 
@@ -1260,17 +1603,13 @@ class ChessAnalysis:
             dict[str, tuple[SingleGame, ...]]: The games filtered by time control for the given openings.
         """
                 
-        games = defaultdict(list)
-        for opening in openings:
-            _updateDateGames(games, opening, gamesBound, eloBound)
+        sortedGames = _initGamesByDate(gamesBound, eloBound, reverse, openings)
+        slicedTop = _slicedTopSingleGames(sortedGames, takeTop)
 
-        for date, game_list in games.items():
-            game_list.sort(key=lambda game: game.getGameError(), reverse=reverse)
-        sortedGames = [(date, games) for date, games in games.items()]
-        _slicedTopSingleGames(sortedGames, takeTop)
-
-        result = _initResult(sortedGames)
-        PlotFactory(result, plot, Constants.AVG_ERROR_TITLE, Constants.AVG_ERROR_X_LABEL, Constants.AVG_ERROR_Y_LABEL)
+        result = _initResult(slicedTop)
+        if plot:
+            PlotFactory(result, plot, Constants.AVG_ERROR_TITLE, Constants.AVG_ERROR_X_LABEL,
+                        Constants.AVG_ERROR_Y_LABEL)
 
         return result
 
@@ -1303,7 +1642,8 @@ class ChessAnalysis:
         for opening in openings:
             _updateResultGames(games, opening, gamesBound)
 
-        return {key: tuple(value) for key, value in games.items()}
+        # Games are grouped by the result itself, so each result is translated to its name once rather than per game
+        return {ChessResult.chessResultToStr(key): tuple(value) for key, value in games.items()}
 
     def getMostCommonOpening(self, opening: str = None) -> Union[OpeningData, Tuple[OpeningData, ...]]:
         """
@@ -1321,7 +1661,7 @@ class ChessAnalysis:
         else:
             if opening not in self._openingsStats:
                 raise ValueError(Constants.NO_OPENING_ERR)
-            return self._getMostCommon(self._openingsStats[opening].getVariation())
+            return self._getMostCommon(self._openingsStats[opening].getMostCommonVariations())
 
     def getOpeningStats(self, openingName: Union[str, list[str]]) -> Union[OpeningData, Tuple[OpeningData, ...]]:
         """
@@ -1344,7 +1684,7 @@ class ChessAnalysis:
             Union[Tuple[OpeningData, ...], None]: The most accurate opening(s).
         """
         
-        return tuple(self._extractOpeningInstance(list(self.getAvgError(takeTop=1).keys())))
+        return self._extremeOpenings(self.getAvgError(), _averageErrorOf, first=True)
 
     def getBestOpeningRecord(self) -> Union[Tuple[OpeningData, ...], None]:
         """
@@ -1354,7 +1694,7 @@ class ChessAnalysis:
             Union[Tuple[OpeningData, ...], None]: The opening(s) with the best record.
         """
         
-        return tuple(self._extractOpeningInstance(list(self.getRecord(takeTop=1).keys())))
+        return self._extremeOpenings(self.getRecord(), _averagePointsOf, first=True)
 
     def getLeastAccurateOpening(self) -> Union[Tuple[OpeningData, ...], None]:
         """
@@ -1364,7 +1704,7 @@ class ChessAnalysis:
             Union[Tuple[OpeningData, ...], None]: The least accurate opening(s).
         """
         
-        return tuple(self._extractOpeningInstance(list(self.getAvgError(takeTop=1, reverse=False).keys())))
+        return self._extremeOpenings(self.getAvgError(), _averageErrorOf, first=False)
 
     def getWorstOpening(self) -> Union[Tuple[OpeningData, ...], None]:
         """
@@ -1374,7 +1714,28 @@ class ChessAnalysis:
             Union[Tuple[OpeningData, ...], None]: The worst opening(s).
         """
         
-        return tuple(self._extractOpeningInstance(list(self.getRecord(takeTop=1, reverse=False).keys())))
+        return self._extremeOpenings(self.getRecord(), _averagePointsOf, first=False)
+
+    def _extremeOpenings(self, sortedResult: dict[str, Any], key: Callable[[Tuple[str, Any]], Any], first: bool) \
+            -> Tuple[OpeningData, ...]:
+        """
+        Gets the openings tied at either end of a full, sorted per-opening result.
+
+        The best/worst accessors share the (cached) default call of the underlying method this way, instead of each
+        running it with their own takeTop and reverse.
+
+        Args:
+            sortedResult (dict[str, Any]): The per-opening result, in its sorted order.
+            key (Callable[[Tuple[str, Any]], Any]): Function extracting the value the result is sorted by.
+            first (bool): Whether to take the openings at the start rather than at the end.
+
+        Returns:
+            Tuple[OpeningData, ...]: The openings tied at that end, in the result's order.
+        """
+        items = list(sortedResult.items())
+        extremes = _takeTopRanks(items if first else items[::-1], 1, key)
+        names = [name for name, _ in (extremes if first else extremes[::-1])]
+        return tuple(self._extractOpeningInstance(names))
 
     def getAllGames(self) -> list[SingleGame]:
         """
@@ -1394,32 +1755,25 @@ class ChessAnalysis:
             output_file (str): The name of the output CSV file. Defaults to 'exported_data.csv'.
 
         """
-        data_to_export = self._allGames  # or any other data structure you want to export
-
-        # Define the headers for the CSV
-        headers = Constants.CSV_HEADERS
-
-        # Open the CSV file for writing
-        
-        with open(output_file, mode='w', newline='') as file:
+        games = self._allGames
+
+        # Whole columns are formatted at once, so no row is built or formatted game by game
+        columns = (
+            np.datetime_as_string(self._gameDates, unit='D'),
+            [game.getOpponent() for game in games],
+            [ChessResult.chessResultToStr(game.getGameResult()) for game in games],
+            [game.getElo() for game in games],
+            self._gameOpponentElos.tolist(),
+            [game.getMainOpening() for game in games],
+            [game.getVariation() or 'N/A' for game in games],
+            [game.getMoveLeavingOpening() for game in games],
+            self._gameTimeControls.tolist(),
+            self._gameTimeBonuses.tolist(),
+            _joinFormatted([game.getErrorPerMove() for game in games]),
+            _joinFormatted([game.getTimeSpent() for game in games])
+        )
+
+        with open(output_file, mode='w', newline='', buffering=Constants.CSV_WRITE_BUFFER_SIZE) as file:
             writer = csv.writer(file)
-            writer.writerow(headers)  # Write the headers
-
-            # Iterate over the data and write each row
-            
-            for game in data_to_export:
-                row = [
-                    game.getDate().strftime("%Y-%m-%d"),
-                    game.getOpponent(),
-                    ChessResult.chessResultToStr(game.getGameResult()),
-                    game.getElo(),
-                    game.getOpponentElo(),
-                    game.getMainOpening(),
-                    game.getVariation() or 'N/A',
-                    game.getMoveLeavingOpening(),
-                    game.getTimeControl(),
-                    game.getTimeBonus(),
-                    ';'.join(f'{x:.2f}' for x in game.getErrorPerMove()),  # Format floats to 2 decimal places
-                    ';'.join(f'{x:.2f}' for x in game.getTimeSpent())  # Format floats to 2 decimal places
-                ]
-                writer.writerow(row)
+            writer.writerow(Constants.CSV_HEADERS)
+            writer.writerows(zip(*columns))
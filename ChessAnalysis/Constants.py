@@ -7,7 +7,6 @@ CLOCK_PATTERN = r'\d{1,2}:\d{2}:\d{2}(\.\d+)?'
 BLACK_MOVE_NUMBER_PATTERN = r'\d+\.\.\.\s*'
 WHITE_MOVE_NUMBER_PATTERN_NO_END_LINE = r'\d+\. '
 WHITE_MOVE_NUMBER_PATTERN_END_OF_LINE = r'\d+\.\n'
-ONE_LINE_PATTERN = r'\s*\n\s*'
 DRAW = "1/2"
 WIN = "1"
 LOSS = "0"
@@ -19,14 +18,15 @@ WHITE_ELO_METADATA = "WhiteElo"
 BLACK_ELO_METADATA = "BlackElo"
 RESULT_METADATA = "Result"
 TIME_CONTROL_METADATA = "TimeControl"
-INVALID_MOVE_NUMBER = "Invalid move number!. Move number must be greater than zero!"
+HEADER_PATTERN = r'\[({})\s+"([^"]*)"\]'
 NO_PGN_FILES_ERR = "No .pgn files found!"
 FILE_NOT_PGN_ERR = "File is not a .pgn file!"
 CLK_PATTERN_1 = r'\{\[%clk\s*(\d+:\d+:\d+:\d+\.\d+)\s*]}'
 CLK_PATTERN_2 = r'\{\[%clk\s*(\d+:\d+:\d+\.\d+)\s*]}'
 CLK_PATTERN_3 = r'\{\[%clk\s+(\d+:\d+:\d+)]}'
 CLK_PATTERN_4 = r'\{\[%clk\s+(\d+\.\d+)]}'
-TIME_PATTERN = r'(\d+):(\d+):(\d+)(\.\d+)?'
+TIME_SEPERATOR = ":"
+FRACTION_SEPERATOR = "."
 CLK_PATTERN_GROUP = r'\1'
 STOCKFISH_DIR = '/Users/tomerkeinan/PycharmProjects/ChessLib/Resources/stockfish-macos-m1-apple-silicon'
 NO_FORCED_MATE = 'cp'
@@ -46,6 +46,10 @@ USERNAME_NOT_MATCH_ERR = "Username does not match!"
 NO_MAIN_OPENING_SPECIFIED_ERR = "If variation has selected, opening must be specified"
 NO_OPENING_BUT_THERE_IS_SIMILAR_ERR = ('Could not find the given variation, maybe you did not played that'
                                        'variation at all, or maybe you meant one of these variations?: {}')
+TOO_MANY_ARGUMENTS_ERR = "{}() takes {} arguments but {} positional arguments were given"
+UNEXPECTED_ARGUMENT_ERR = "{}() got an unexpected keyword argument '{}'"
+MULTIPLE_VALUES_ERR = "{}() got multiple values for argument '{}'"
+MISSING_ARGUMENT_ERR = "{}() missing a required argument: '{}'"
 NO_OPENING_ERR = "No opening found!, maybe you did not played that opening at all."
 LOSS_KEY = "losses"
 WIN_KEY = "wins"
@@ -63,6 +67,7 @@ INVALID_TIME_CONTROL = "timeControl must be of type str, with format of int [Opt
 NORMALIZED_ERROR = 1
 ROUNDING_ERROR = 3
 ROUNDING_TIME = 2
+MOVE_STATS_INITIAL_CAPACITY = 16
 OPENINGS_ARG = "openings"
 TAKE_TOP_ARG = "takeTop"
 REVERSE_ARG = "reverse"
@@ -93,7 +98,9 @@ MIN_VAL_FOR_SET_GAP = 1
 PGN_META_DATA_TO_GAME_SEPERATOR = "\n\n"
 UNKNOWN_OPENING = "Unknown opening"
 MAX_TAKE_TOP = 100000
-REMOVE_DUPLICATE = 'self'
+PARSE_CACHE_SIZE = 1024
+RESULT_CACHE_SIZE = 128
+PARTIAL_SORT_RATIO = 4
 DRAW_POINTS = 0.5
 NO_TIME_BONUS = 0
 WHITE_AND_BLACK_PLAYED_ONCE_FLAG = "1..."
@@ -131,6 +138,17 @@ NEXT_MOVE_JUMP = 4
 WHITE_FIRST_MOVE_IND = 1
 BLACK_FIRST_MOVE_IND = 3
 DEFAULT_IS_VARIATION = False
+DEFAULT_WORKERS = 1
+ANALYSIS_CHUNKS_PER_WORKER = 4
+DEFAULT_STOCKFISH_PATH = "stockfish"
+ENGINE_HASH_PARAMETER = "Hash"
+MINIMUM_ENGINE_HASH_MB = 512
+UCINEWGAME_TOKEN_ARG = "send_ucinewgame_token"
+EVAL_CACHE_SIZE = 10 ** 6
+OPENING_NGRAM_SIZE = 4
+GAME_DATE_UNIT = 'us'
+GAME_DATE_DTYPE = f'datetime64[{GAME_DATE_UNIT}]'
+GROUPING_DATE_DTYPE = 'datetime64[D]'
 PROCESS_ANALYZE_MSG = 'start analyzing game {}. There are total {} games to analyze.'
 TIME_CONTROL_SEPERATOR = "+"
 DICT_TO_PLOT_ERR = "dictToPlot must be of type dict."
@@ -167,10 +185,15 @@ BY_DATE_TITLE = "Avg Error Per Date"
 BY_DATE_X_LABEL = "Date"
 BY_DATE_Y_LABEL = "Avg Error"
 MAXIMUM_ITEMS_PER_BAR = 10
+NUMERIC_DTYPE_KINDS = 'biuf'
 CSV_HEADERS = [
             'Date', 'Opponent', 'Result', 'User Elo', 'Opponent Elo',
             'Main Opening', 'Variation', 'Move Leaving Opening',
             'Time Control', 'Time Bonus', 'Precision Per Move', 'Time Spent Per Move'
         ]
+CSV_FLOAT_FORMAT = '%.2f'
+CSV_WRITE_BUFFER_SIZE = 1 << 20
 VALID_GAME_EXTENSION = ".pgn"
+OPENING_BOOK_DIR = "OpeningBooks"
 VALID_OPENING_BOOK_EXTENSION = ".tsv"
+OPENING_BOOK_ENCODING = "utf-8"
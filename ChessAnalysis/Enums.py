@@ -15,20 +15,21 @@ class ChessResult(Enum):
 
     @staticmethod
     def chessResultToStr(result) -> str:
-        if result == ChessResult.WIN:
-            return Constants.WIN_KEY
-        elif result == ChessResult.DRAW:
-            return Constants.DRAW_KEY
-        elif result == ChessResult.LOSS:
-            return Constants.LOSS_KEY
-        else:
+        try:
+            return _CHESS_RESULT_TO_STR[result]
+        except (KeyError, TypeError):
             raise ValueError("Invalid ChessResult value")
 
     @staticmethod
     def numToChessResult(result: Union[float, int, list[Union[float, int], ...]]):
-        chessResTranslator = {Constants.ENUM_WIN_KEY: ChessResult.WIN, Constants.ENUM_DRAW_KEY: ChessResult.DRAW,
-                              Constants.ENUM_LOSS_KEY: ChessResult.LOSS}
         if isinstance(result, (float, int)):
-            return (chessResTranslator[result],)
+            return (_CHESS_RESULT_TRANSLATOR[result],)
         else:
-            return tuple(chessResTranslator[r] for r in result if r in chessResTranslator)
+            return tuple(_CHESS_RESULT_TRANSLATOR[r] for r in result if r in _CHESS_RESULT_TRANSLATOR)
+
+
+# Built once here, as a dict assigned inside the Enum body would become a member
+_CHESS_RESULT_TRANSLATOR = {Constants.ENUM_WIN_KEY: ChessResult.WIN, Constants.ENUM_DRAW_KEY: ChessResult.DRAW,
+                            Constants.ENUM_LOSS_KEY: ChessResult.LOSS}
+_CHESS_RESULT_TO_STR = {ChessResult.WIN: Constants.WIN_KEY, ChessResult.DRAW: Constants.DRAW_KEY,
+                        ChessResult.LOSS: Constants.LOSS_KEY}
@@ -1,19 +1,58 @@
 from . import Constants
 from .SingleGame import SingleGame
-from copy import deepcopy
-from typing import Literal, Union
+from typing import Literal
+import numpy as np
+
+
+def _applyUpdate(totalError: np.ndarray, totalTime: np.ndarray, totalMoves: np.ndarray, error: np.ndarray,
+                 time: np.ndarray, updateState: Literal[-1, 1]) -> None:
+    """
+    Apply one game's moves to the total fields in place, without allocating intermediate arrays.
+
+    Args:
+        totalError (np.ndarray): The total error of the game's move numbers, updated in place.
+        totalTime (np.ndarray): The total time of the game's move numbers, updated in place.
+        totalMoves (np.ndarray): The times each of the game's move numbers was played, updated in place.
+        error (np.ndarray): The game's error per move. It is used as scratch space.
+        time (np.ndarray): The game's time spent per move. It is used as scratch space.
+        updateState (Literal[-1, 1]): The state to indicate whether to add (1) or remove (-1) data.
+    """
+    np.add(totalError, np.multiply(error, updateState, out=error), out=totalError)
+    np.add(totalTime, np.multiply(time, updateState, out=time), out=totalTime)
+    np.add(totalMoves, updateState, out=totalMoves)
+
+
+def _averageInto(totals: np.ndarray, moves: np.ndarray, out: np.ndarray) -> None:
+    """
+    Divide the totals by the times each move number was played, writing 0 for move numbers no longer played.
+
+    Args:
+        totals (np.ndarray): The totals per move number.
+        moves (np.ndarray): The times each move number was played.
+        out (np.ndarray): The averages per move number, written in place.
+    """
+    played = moves != 0
+    out[~played] = 0
+    np.divide(totals, moves, out=out, where=played)
 
 
 class MoveStatistics:
     """
     A class to keep track of and manage move statistics for chess games.
+
+    The per-move fields are arrays with spare capacity, of which the first `_len` entries are in use. The averages
+    are only brought up to date when read; the first `_dirty` of them may be stale until then.
     """
+    __slots__ = ('_len', '_dirty', '_total_error', '_total_time', '_total_moves', '_avg_error', '_avg_time')
+
     def __init__(self) -> None:
-        self._total_error: list[Union[int, float]] = []
-        self._total_time: list[Union[int, float]] = []
-        self._total_moves: list[Union[int, float]] = []
-        self._avg_error: list[float] = []
-        self._avg_time: list[float] = []
+        self._len = 0
+        self._dirty = 0
+        self._total_error = np.zeros(Constants.MOVE_STATS_INITIAL_CAPACITY, dtype=np.float64)
+        self._total_time = np.zeros(Constants.MOVE_STATS_INITIAL_CAPACITY, dtype=np.float64)
+        self._total_moves = np.zeros(Constants.MOVE_STATS_INITIAL_CAPACITY, dtype=np.int32)
+        self._avg_error = np.zeros(Constants.MOVE_STATS_INITIAL_CAPACITY, dtype=np.float64)
+        self._avg_time = np.zeros(Constants.MOVE_STATS_INITIAL_CAPACITY, dtype=np.float64)
 
     def __copy__(self):
         return self.__deepcopy__({})
@@ -29,12 +68,15 @@ class MoveStatistics:
             MoveStatistics: A deep copy of the current instance.
         """
 
-        new_instance = MoveStatistics()
-        new_instance._total_error = deepcopy(self._total_error, memo)
-        new_instance._total_time = deepcopy(self._total_time, memo)
-        new_instance._total_moves = deepcopy(self._total_moves, memo)
-        new_instance._avg_error = deepcopy(self._avg_error, memo)
-        new_instance._avg_time = deepcopy(self._avg_time, memo)
+        # The constructor is skipped, as its empty fields would be replaced right away.
+        new_instance = MoveStatistics.__new__(MoveStatistics)
+        new_instance._len = self._len
+        new_instance._dirty = self._dirty
+        new_instance._total_error = self._total_error.copy()
+        new_instance._total_time = self._total_time.copy()
+        new_instance._total_moves = self._total_moves.copy()
+        new_instance._avg_error = self._avg_error.copy()
+        new_instance._avg_time = self._avg_time.copy()
 
         return new_instance
 
@@ -48,99 +90,53 @@ class MoveStatistics:
             updateState (Literal[-1, 1]): The state to indicate whether to add (1) or remove (-1) data.
         """
         timeSpentPerMove, errorPerMove = game.getTimeSpent(), game.getErrorPerMove()
-        moveNumbering = range(len(timeSpentPerMove))
-        for idx, time, error in zip(moveNumbering, timeSpentPerMove, errorPerMove):
-            time, idx = updateState * time, updateState * idx
-            self._updateOneMove(idx, time, error, updateState)
+        n = min(len(timeSpentPerMove), len(errorPerMove))
+        self._ensureCapacity(n)
 
-    def _updateOneMove(self, moveNum, time, error, updateState: Literal[-1, 1]):
-        """
-        Update the statistics for a single move.
+        _applyUpdate(self._total_error[:n], self._total_time[:n], self._total_moves[:n],
+                     np.array(errorPerMove[:n], dtype=np.float64), np.array(timeSpentPerMove[:n], dtype=np.float64),
+                     updateState)
+        self._dirty = max(self._dirty, n)
 
-        Args:
-            moveNum (int): The move number.
-            time (float): The time spent on the move.
-            error (float): The error for the move.
-            updateState (Literal[-1, 1]): The state to indicate whether to add (1) or remove (-1) data.
+    def _ensureCapacity(self, n: int) -> None:
         """
-        if moveNum < 0:
-            raise ValueError(Constants.INVALID_MOVE_NUMBER)
-
-        if self._isThisMoveNumberEverPlayed(moveNum):
-            self._updateTotalFields(moveNum, error, time, updateState)
-            self._updateAvgFields(moveNum)
-        else:
-            self._initTotalFields(error, time)
-            self._initAvgFields(error, time)
-
-    def _isThisMoveNumberEverPlayed(self, moveNum):
-        """
-        Check if a move number has been played before.
+        Make room for the first n move numbers, doubling the capacity of the fields as needed.
 
         Args:
-            moveNum (int): The move number to check.
-
-        Returns:
-            bool: True if the move number has been played before, False otherwise.
-        """
-        return len(self._avg_error) > moveNum
-
-    def _initAvgFields(self, error, time):
+            n (int): The number of move numbers that must fit.
         """
-         Initialize the average fields for a move.
-
-         Args:
-             error (float): The error for the move.
-             time (float): The time spent on the move.
-         """
-        self._avg_error.append(error)
-        self._avg_time.append(time)
+        if n > self._total_error.size:
+            capacity = self._total_error.size
+            while capacity < n:
+                capacity *= 2
+            for name in ('_total_error', '_total_time', '_total_moves', '_avg_error', '_avg_time'):
+                field = getattr(self, name)
+                grown = np.zeros(capacity, dtype=field.dtype)
+                grown[:self._len] = field[:self._len]
+                setattr(self, name, grown)
+        self._len = max(self._len, n)
 
-    def _initTotalFields(self, error, time):
+    def _refreshAvgFields(self) -> None:
         """
-        Initialize the total fields for a move.
-
-        Args:
-            error (float): The error for the move.
-            time (float): The time spent on the move.
-        """
-        self._total_error.append(error)
-        self._total_time.append(time)
-        self._total_moves.append(1)
-
-    def _updateAvgFields(self, moveNum):
-        """
-        Update the average fields for a move number.
-
-        Args:
-            moveNum (int): The move number to update.
-        """
-        self._avg_error[moveNum] = self._total_error[moveNum] / self._total_moves[moveNum]
-        self._avg_time[moveNum] = self._total_time[moveNum] / self._total_moves[moveNum]
-
-    def _updateTotalFields(self, moveNum: int, error, time, updateState: Literal[1, -1]) -> None:
-        """
-        Update the total fields for a move number.
-
-        Args:
-            moveNum (int): The move number to update.
-            error (float): The error for the move.
-            time (float): The time spent on the move.
-            updateState (Literal[1, -1]): The state to indicate whether to add (1) or remove (-1) data.
+        Recompute the stale averages in one pass over the move numbers updated since the last read.
         """
-        self._total_error[moveNum] += error
-        self._total_time[moveNum] += time
-        self._total_moves[moveNum] += updateState
+        if self._dirty:
+            n = self._dirty
+            _averageInto(self._total_error[:n], self._total_moves[:n], self._avg_error[:n])
+            _averageInto(self._total_time[:n], self._total_moves[:n], self._avg_time[:n])
+            self._dirty = 0
 
     def clear(self) -> None:
         """
          Clear all the move statistics.
          """
-        self._total_error.clear()
-        self._total_time.clear()
-        self._total_moves.clear()
-        self._avg_error.clear()
-        self._avg_time.clear()
+        self._total_error[:self._len] = 0
+        self._total_time[:self._len] = 0
+        self._total_moves[:self._len] = 0
+        self._avg_error[:self._len] = 0
+        self._avg_time[:self._len] = 0
+        self._len = 0
+        self._dirty = 0
 
     def get_avg_error(self) -> list[float]:
         """
@@ -149,7 +145,8 @@ class MoveStatistics:
         Returns:
             list[float]: A list of average errors rounded to the specified precision.
         """
-        return [round(error, Constants.ROUNDING_ERROR) for error in self._avg_error]
+        self._refreshAvgFields()
+        return [round(error, Constants.ROUNDING_ERROR) for error in self._avg_error[:self._len].tolist()]
 
     def get_avg_time(self) -> list[float]:
         """
@@ -158,7 +155,8 @@ class MoveStatistics:
         Returns:
             list[float]: A list of average times rounded to the specified precision.
         """
-        return [round(avgTime, Constants.ROUNDING_TIME) for avgTime in self._avg_time]
+        self._refreshAvgFields()
+        return [round(avgTime, Constants.ROUNDING_TIME) for avgTime in self._avg_time[:self._len].tolist()]
 
     def get_total_moves(self) -> list[int]:
         """
@@ -167,4 +165,4 @@ class MoveStatistics:
         Returns:
             list[int]: A list of total moves.
         """
-        return self._total_moves
+        return self._total_moves[:self._len].tolist()
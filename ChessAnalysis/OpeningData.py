@@ -2,9 +2,11 @@ from . import Constants
 from .MoveStats import MoveStatistics
 from .SingleGame import SingleGame
 from .Enums import ChessResult
-from typing import Callable, Any
+from typing import Callable, Any, Union
 from math import ceil
-from copy import deepcopy
+from copy import copy, deepcopy
+from functools import wraps
+import numpy as np
 
 
 def increment_totalGames(method: Callable) -> Callable:
@@ -23,7 +25,91 @@ def increment_totalGames(method: Callable) -> Callable:
     return wrapper
 
 
+# Result counts are kept in a vector with one column per record key, in the order getRecord reports them.
+_RECORD_KEYS = (Constants.WIN_KEY, Constants.LOSS_KEY, Constants.DRAW_KEY)
+_RESULT_TO_COLUMN = {ChessResult.WIN: 0, ChessResult.LOSS: 1, ChessResult.DRAW: 2}
+_DRAW_COLUMN = _RESULT_TO_COLUMN[ChessResult.DRAW]
+
+
+def _cachedAggregate(opening: 'OpeningData', method: Callable) -> Any:
+    """
+    Get an aggregate of the opening's game history, computing it only once per change of the history.
+
+    Args:
+        opening (OpeningData): The opening the aggregate is of.
+        method (Callable): The method computing the aggregate.
+
+    Returns:
+        Any: The cached aggregate.
+    """
+    if opening._aggregatesEpoch != opening._epoch:
+        opening._aggregates = {}
+        opening._aggregatesEpoch = opening._epoch
+    if method.__name__ not in opening._aggregates:
+        opening._aggregates[method.__name__] = method(opening)
+    return opening._aggregates[method.__name__]
+
+
+def cachedUntilChanged(method: Callable) -> Callable:
+    """
+    Decorator to compute an aggregate of the game history once per change of the history.
+
+    Args:
+        method (Callable): The method to be wrapped.
+
+    Returns:
+        Callable: The wrapped method, returning a copy of the cached aggregate.
+    """
+    @wraps(method)
+    def wrapper(self) -> Any:
+        return copy(_cachedAggregate(self, method))
+    return wrapper
+
+
+def sharedUntilChanged(method: Callable) -> Callable:
+    """
+    Decorator to compute an aggregate of the game history once per change of the history, sharing it with callers.
+
+    Args:
+        method (Callable): The method to be wrapped.
+
+    Returns:
+        Callable: The wrapped method, returning the cached aggregate itself, which must not be modified.
+    """
+    @wraps(method)
+    def wrapper(self) -> Any:
+        return _cachedAggregate(self, method)
+    return wrapper
+
+
+def updateMostCommon(mostCommon: list['OpeningData'], candidate: 'OpeningData',
+                     openings: dict[str, 'OpeningData']) -> None:
+    """
+    Update the list of openings tied for the most games after a game was added to one of them.
+
+    Args:
+        mostCommon (list[OpeningData]): The openings tied for the most games in the order of `openings`, updated in
+            place.
+        candidate (OpeningData): The opening a game was just added to.
+        openings (dict[str, OpeningData]): All the openings, in the order ties are listed in.
+    """
+    # A tied opening that just got a game is now ahead of the rest of the ties.
+    if candidate in mostCommon or not mostCommon or candidate.getTotalGames() > mostCommon[0].getTotalGames():
+        mostCommon[:] = [candidate]
+    elif candidate.getTotalGames() == mostCommon[0].getTotalGames():
+        if candidate is next(reversed(openings.values())):
+            mostCommon.append(candidate)
+        else:
+            tied = set(map(id, mostCommon))
+            mostCommon[:] = [opening for opening in openings.values()
+                             if opening is candidate or id(opening) in tied]
+
+
 class OpeningData:
+    __slots__ = ('_openingName', '_variations', '_moveStats', '_totalGames', '_gameHistory', '_isVariation',
+                 '_mostCommonVariations', '_epoch', '_aggregatesEpoch', '_aggregates', '_resultCounts',
+                 '_sumGameError', '_sumMoveLeavingOpening', '_variationList')
+
     def __init__(self, openingName: str = Constants.DEFAULT_OPENING_DATA_NAME,
                  isVariation=Constants.DEFAULT_IS_VARIATION) -> None:
         """
@@ -35,26 +121,39 @@ class OpeningData:
         """
         self._openingName = openingName
         self._variations: dict[str, OpeningData] = {}
+        self._variationList: Union[list[OpeningData], None] = None  # Rebuilt once a variation is added.
         self._moveStats = MoveStatistics()
         self._totalGames = 0
-        self._gameHistory: list[SingleGame] = []
+        self._gameHistory: dict[int, SingleGame] = {}  # Keyed by id, in the order the games were added.
         self._isVariation = isVariation
+        self._mostCommonVariations: Union[list[OpeningData], None] = []
+        self._epoch = 0  # Bumped whenever the game history changes.
+        self._aggregatesEpoch = 0
+        self._aggregates: dict[str, Any] = {}
+        self._resultCounts = np.zeros(len(_RECORD_KEYS), dtype=np.int64)
+        self._sumGameError = 0
+        self._sumMoveLeavingOpening = 0
 
     def __copy__(self):
         return self.__deepcopy__({})
 
     def __deepcopy__(self, memo):
         new_instance = OpeningData(self._openingName, self._isVariation)
-        new_instance._moveStats = deepcopy(self._moveStats, memo)
-        new_instance._gameHistory = deepcopy(self._gameHistory, memo)
+        new_instance._moveStats = copy(self._moveStats)
+        # The games are shared rather than copied, as an opening only reads them.
+        new_instance._gameHistory = self._gameHistory.copy()
         new_instance._variations = {key: deepcopy(v, memo) for key, v in self._variations.items()}
         new_instance._totalGames = self._totalGames
+        new_instance._resultCounts = self._resultCounts.copy()
+        new_instance._sumGameError = self._sumGameError
+        new_instance._sumMoveLeavingOpening = self._sumMoveLeavingOpening
+        new_instance._mostCommonVariations = None
         return new_instance
 
     def __iter__(self):
         """Return an iterator over the game history."""
 
-        return iter(self._gameHistory)
+        return iter(self._gameHistory.values())
 
     def __len__(self):
         """Return the number of games in the game history."""
@@ -68,8 +167,10 @@ class OpeningData:
         Args:
             game (SingleGame): The game to be added.
         """
-        self._gameHistory.append(game)
+        self._gameHistory[id(game)] = game
         self._moveStats.update(game)
+        self._updateSummary(game, Constants.APPEND)
+        self._epoch += 1
 
     @increment_totalGames
     def addVariation(self, game: SingleGame, variation: str) -> None:
@@ -85,7 +186,10 @@ class OpeningData:
         if variation not in self._variations:
             self._variations[variation] = OpeningData(self._openingName + Constants.OPENING_SEPERATOR + variation,
                                                       True)
+            self._variationList = None
         self._variations[variation].addGame(game)
+        if self._mostCommonVariations is not None:
+            updateMostCommon(self._mostCommonVariations, self._variations[variation], self._variations)
 
     def removeGame(self, game: SingleGame) -> None:
         """
@@ -97,14 +201,28 @@ class OpeningData:
         Raises:
             ValueError: If the game is not found in the game history.
         """
-        if game not in self._gameHistory:
+        if self._gameHistory.pop(id(game), None) is None:
             raise ValueError(Constants.GAME_NOT_FOUND_ERR)
-        self._gameHistory.remove(game)
         self._moveStats.update(game, updateState=Constants.REMOVE)
+        self._updateSummary(game, Constants.REMOVE)
         self._decreaseTotalGames()
+        self._epoch += 1
 
         if game.getVariation() is not None and not self._isVariation:
             self._variations[game.getVariation()].removeGame(game)
+            self._mostCommonVariations = None  # A count went down, rebuilt on the next lookup.
+
+    def _updateSummary(self, game: SingleGame, updateState: int) -> None:
+        """
+        Add (1) or remove (-1) a game's result, error and move leaving the opening to the running totals.
+
+        Args:
+            game (SingleGame): The game being added or removed.
+            updateState (int): The state to indicate whether to add (1) or remove (-1) data.
+        """
+        self._resultCounts[_RESULT_TO_COLUMN.get(game.getGameResult(), _DRAW_COLUMN)] += updateState
+        self._sumGameError += updateState * game.getGameError()
+        self._sumMoveLeavingOpening += updateState * game.getMoveLeavingOpening()
 
     def getName(self) -> str:
         """
@@ -115,6 +233,7 @@ class OpeningData:
         """
         return self._openingName
 
+    @cachedUntilChanged
     def getTimeSpent(self) -> list[float]:
         """
         Get the average time spent per move.
@@ -124,6 +243,7 @@ class OpeningData:
         """
         return self._moveStats.get_avg_time()
 
+    @cachedUntilChanged
     def getErrorPerMove(self) -> list[float]:
         """
         Get the average error per move.
@@ -140,10 +260,7 @@ class OpeningData:
         Returns:
             float: The average error for the opening.
         """
-        total_error = 0
-        for game in self._gameHistory:
-            total_error += game.getGameError()
-        return total_error/len(self._gameHistory)
+        return self._sumGameError / len(self._gameHistory)
 
     def getTotalMoves(self) -> list[int]:
         """
@@ -161,15 +278,7 @@ class OpeningData:
         Returns:
             dict[str, int]: The record of wins, losses, and draws.
         """
-        loss, draws, wins = 0, 0, 0
-        for game in self._gameHistory:
-            if game.getGameResult() == ChessResult.WIN:
-                wins += 1
-            elif game.getGameResult() == ChessResult.LOSS:
-                loss += 1
-            else:
-                draws += 1
-        return {Constants.WIN_KEY: wins, Constants.LOSS_KEY: loss, Constants.DRAW_KEY: draws}
+        return dict(zip(_RECORD_KEYS, self._resultCounts.tolist()))
 
     def getAvgMoveLeavingOpening(self) -> int:
         """
@@ -178,10 +287,7 @@ class OpeningData:
         Returns:
             int: The average move number when leaving the opening.
         """
-        totalMoveLeavingOpening = 0
-        for game in self._gameHistory:
-            totalMoveLeavingOpening += game.getMoveLeavingOpening()
-        return ceil(totalMoveLeavingOpening / len(self._gameHistory))
+        return ceil(self._sumMoveLeavingOpening / len(self._gameHistory))
 
     def _increaseTotalGames(self) -> None:
         self._totalGames += 1
@@ -206,22 +312,40 @@ class OpeningData:
             variation (str, optional): The name of the variation. Defaults to None.
 
         Returns:
-            Union[list[OpeningData], OpeningData, None]: The variation data.
+            Union[list[OpeningData], OpeningData, None]: The variation data. The list of all variations is shared
+            between calls and must not be modified.
         """
         if variation is None:
-            return list(self._variations.values())
+            if self._variationList is None:
+                self._variationList = list(self._variations.values())
+            return self._variationList
         if variation not in self._variations:
             return None
         return self._variations[variation]
 
+    def getMostCommonVariations(self) -> list['OpeningData']:
+        """
+        Get the variations tied for the most games.
+
+        Returns:
+            list[OpeningData]: The most common variations.
+        """
+        if self._mostCommonVariations is None:
+            mostGames = max((variation.getTotalGames() for variation in self._variations.values()), default=0)
+            self._mostCommonVariations = [variation for variation in self._variations.values()
+                                          if variation.getTotalGames() == mostGames]
+        return self._mostCommonVariations
+
+    @sharedUntilChanged
     def getGames(self) -> list[SingleGame]:
         """
         Get the game history.
 
         Returns:
-            list[SingleGame]: The game history.
+            list[SingleGame]: The game history. The same list is returned until the history changes, so it must not be
+            modified.
         """
-        return self._gameHistory
+        return list(self._gameHistory.values())
 
     def getTotalTimesPlayedMove(self) -> list[int]:
         """
@@ -1,7 +1,10 @@
 from . import Constants
 from .SingleGame import SingleGame
 import matplotlib.pyplot as plt
+import numpy as np
 from numpy import ceil
+from functools import partial
+from typing import Callable, Union, Tuple
 
 
 def calculateAvgPoints(record: list[float, int]) -> float:
@@ -17,6 +20,59 @@ def calculateAvgPoints(record: list[float, int]) -> float:
     return record[0] + record[1] * Constants.DRAW_POINTS
 
 
+def calculateAvgPointsPerRecord(records: list[tuple]) -> list[float]:
+    """
+    Calculate the average points of every record at once.
+
+    Args:
+        records (list[tuple]): The records, each starting with the win and draw points.
+
+    Returns:
+        list[float]: The calculated average points of each record.
+    """
+    try:
+        table = np.array(records, dtype=np.float64).reshape(len(records), -1)
+    except ValueError:  # Records of different lengths
+        return [calculateAvgPoints(record) for record in records]
+    return (table[:, 0] + table[:, 1] * Constants.DRAW_POINTS).tolist()
+
+
+def calculateErrorSums(gameTuples: list[tuple[SingleGame, ...]]) -> list[float]:
+    """
+    Calculate the total error of every tuple of games at once.
+
+    Args:
+        gameTuples (list[tuple[SingleGame, ...]]): The tuples of games.
+
+    Returns:
+        list[float]: The total error of each tuple.
+    """
+    sizes = np.fromiter((len(tup) for tup in gameTuples), dtype=np.intp, count=len(gameTuples))
+    errors = np.fromiter((game.getGameError() for tup in gameTuples for game in tup), dtype=np.float64,
+                         count=int(sizes.sum()))
+    # Each error is tagged with the index of its tuple, so one bincount sums every tuple (empty ones to 0).
+    return np.bincount(np.repeat(np.arange(len(gameTuples)), sizes), weights=errors,
+                       minlength=len(gameTuples)).tolist()
+
+
+# Each builder turns one kind of dictionary into its x-axis and y-axis values, with no per-item type checks.
+def _floatAxes(values: np.ndarray, dictToPlot: dict) -> Tuple[list, np.ndarray]:
+    return list(dictToPlot.keys()), values
+
+
+def _recordAxes(dictToPlot: dict) -> Tuple[list, list]:
+    return list(dictToPlot.keys()), calculateAvgPointsPerRecord(list(dictToPlot.values()))
+
+
+def _rangeRecordAxes(dictToPlot: dict) -> Tuple[list, list]:
+    return ([f"{key[0]}-{key[1]}" for key in dictToPlot.keys()],
+            calculateAvgPointsPerRecord(list(dictToPlot.values())))
+
+
+def _gamesErrorAxes(dictToPlot: dict) -> Tuple[list, list]:
+    return list(dictToPlot.keys()), calculateErrorSums(list(dictToPlot.values()))
+
+
 class PlotFactory:
     def __init__(self, dictToPlot: dict, plot: bool, title: str, xlabel: str, ylabel: str):
         """
@@ -42,39 +98,37 @@ class PlotFactory:
     def _generate(self) -> None:
         """Generate the plot based on the type of data in the dictionary."""
 
-        if self._typeFloat():
-            self._generateFloatPlot()
-
-        elif self._isTuple():
-            if self._isTupleFloat():
-                if self._isKeysTupFloat():  # type tuple[int, int]: tuple[int, int int]
-                    self._generateTupleFloatWithTupleIntKey()
-                else:
-                    self._generateTupleFloatWithKeyStr()
-            else:  # type is tuple[SingleGame]
-                self._generateTupleSingleGame()
-
-    def _isTupleFloat(self) -> bool:
-        """Check if the values in the dictionary are tuples of floats/integers."""
-
-        return all(isinstance(val, (float, int)) for tup in self._dictToPlot.values() for val in tup)
-
-    def _isKeysTupFloat(self):
-        """Check if the keys in the dictionary are tuples and the values are floats/integers."""
-
-        return all(isinstance(val, tuple) for val in self._dictToPlot.keys()) and all(
-            isinstance(val, (float, int)) for tup in self._dictToPlot.keys() for val in tup)
+        axesBuilder = self._classify()
+        if axesBuilder is not None:
+            self._generatePlot(*axesBuilder(self._dictToPlot))
 
-    def _typeFloat(self) -> bool:
-        """Check if the values in the dictionary are floats/integers."""
-
-        return all(isinstance(key, (float, int)) for key in self._dictToPlot.values())
-
-    def _generateFloatPlot(self) -> None:
-        """Generate a plot for float values."""
+    def _classify(self) -> Union[Callable[[dict], Tuple[list, list]], None]:
+        """
+        Find the axes builder matching the dictionary's data. The first value decides which checks are needed, and
+        each check stops at the first counterexample.
 
-        axis, yaxis = [key for key in self._dictToPlot.keys()], [val for val in self._dictToPlot.values()]
-        self._generatePlot(axis, yaxis)
+        Returns:
+            Union[Callable[[dict], Tuple[list, list]], None]: The axes builder, or None if the data can't be plotted.
+        """
+        values = list(self._dictToPlot.values())
+        if not values or not isinstance(values[0], tuple):
+            # Numbers are recognised from the dtype of one array, which is then reused as the y-axis.
+            try:
+                yaxis = np.asarray(values)
+            except (ValueError, TypeError):
+                return None
+            if yaxis.ndim == 1 and yaxis.dtype.kind in Constants.NUMERIC_DTYPE_KINDS:
+                return partial(_floatAxes, yaxis)
+            return None
+        if not all(isinstance(val, tuple) for val in values):
+            return None
+
+        if not all(isinstance(val, (float, int)) for tup in values for val in tup):  # type is tuple[SingleGame]
+            return _gamesErrorAxes
+        if all(isinstance(key, tuple) and all(isinstance(val, (float, int)) for val in key)
+               for key in self._dictToPlot.keys()):  # type tuple[int, int]: tuple[int, int int]
+            return _rangeRecordAxes
+        return _recordAxes
 
     def _generatePlot(self, axis, yaxis):
         """
@@ -84,9 +138,15 @@ class PlotFactory:
             axis (list): The x-axis values.
             yaxis (list): The y-axis values.
         """
-        for i in range(0, len(axis), Constants.JUMP_TO_MAKE_PLOT_MORE_SPARSE):
-            x = axis[i: i + Constants.JUMP_TO_MAKE_PLOT_MORE_SPARSE]
-            y = yaxis[i: i + Constants.JUMP_TO_MAKE_PLOT_MORE_SPARSE]
+        # Each window is a view into these arrays, so no per-plot lists are built. Labels are assigned one by one so
+        # they are kept as objects, even when they are tuples.
+        axisArray = np.empty(len(axis), dtype=object)
+        for i, label in enumerate(axis):
+            axisArray[i] = label
+        yaxisArray = np.asarray(yaxis)
+        for i in range(0, len(axisArray), Constants.JUMP_TO_MAKE_PLOT_MORE_SPARSE):
+            x = axisArray[i: i + Constants.JUMP_TO_MAKE_PLOT_MORE_SPARSE]
+            y = yaxisArray[i: i + Constants.JUMP_TO_MAKE_PLOT_MORE_SPARSE]
             plt.style.use(Constants.PLOT_STYLE)
 
             if len(x) < Constants.MAXIMUM_ITEMS_PER_BAR:
@@ -114,42 +174,3 @@ class PlotFactory:
         numOfSplitPlots = int(ceil(len(axis) / Constants.JUMP_TO_MAKE_PLOT_MORE_SPARSE))
         if numOfSplitPlots > 1:
             print(Constants.NUM_OF_PLOT_PRINTED.format(self._title, numOfSplitPlots))
-
-    def _isTuple(self) -> bool:
-        """Check if the values in the dictionary are tuples."""
-        return all(isinstance(val, tuple) for val in self._dictToPlot.values())
-
-    def _generateTupleFloatWithKeyStr(self) -> None:
-        """Generate a plot for tuples with string keys."""
-        axis = [key for key in self._dictToPlot.keys()]
-        yaxis = [calculateAvgPoints(record) for record in self._dictToPlot.values()]
-        self._generatePlot(axis, yaxis)
-
-    def _generateTupleFloatWithTupleIntKey(self) -> None:
-        """Generate a plot for tuples with tuple integer keys."""
-        axis = [f"{key[0]}-{key[1]}" for key in self._dictToPlot.keys()]
-        yaxis = [calculateAvgPoints(record) for record in self._dictToPlot.values()]
-        self._generatePlot(axis, yaxis)
-
-    def _generateTupleSingleGame(self) -> None:
-        """Generate a plot for tuples of SingleGame objects."""
-        axis = [key for key in self._dictToPlot.keys()]
-        yaxis = self._calculateAvgSingleGames()
-        self._generatePlot(axis, yaxis)
-
-    def _typeTupleSingleGame(self) -> bool:
-        """Check if the values in the dictionary are tuples of SingleGame objects."""
-
-        return all(isinstance(val, SingleGame) for val in self._dictToPlot.values())
-
-    def _calculateAvgSingleGames(self) -> list[float]:
-        """
-        Calculate the average error for SingleGame tuples.
-
-        Returns:
-            list[float]: The average error for each tuple.
-        """
-        result = []
-        for tup in self._dictToPlot.values():
-            result.append(sum(game.getGameError() for game in tup))
-        return result
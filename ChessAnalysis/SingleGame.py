@@ -1,27 +1,33 @@
-from functools import wraps
+from functools import wraps, lru_cache
 import importlib.resources as pkg_resources
 from .Enums import ChessColor, ChessResult
 from . import Constants
-from typing import Tuple, Union
+from typing import Tuple, Union, Any, Iterator
 from stockfish import Stockfish
 from datetime import datetime
-from copy import deepcopy
+from weakref import WeakKeyDictionary
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import chess
+import inspect
+import numpy as np
 import re
 import os
+import mmap
 
 
-def _changeTurn(turn) -> ChessColor:
-    if turn == ChessColor.WHITE:
-        turn = ChessColor.BLACK
-    else:
-        turn = ChessColor.WHITE
-    return turn
+_CLOCK_RE = re.compile(r'(?<!\S)' + Constants.CLOCK_PATTERN)  # Only at the start of a whitespace-separated token.
+# The opening books are scanned as bytes, straight from the mapped files.
+_OPENING_RE = re.compile(Constants.OPENING_PATTERN.encode(Constants.OPENING_BOOK_ENCODING))
+_OPENING_START_MARKER = Constants.OPENING_START_MARKER.encode(Constants.OPENING_BOOK_ENCODING)
+_OPENING_END_MARKER = Constants.OPENING_END_MARKER.encode(Constants.OPENING_BOOK_ENCODING)
 
 
+@lru_cache(maxsize=1)
 def _openingBookInit() -> dict[str, str]:
     """
-    Initialize the opening book by reading from TSV files in the specified directory.
+    Initialize the opening book by reading from TSV files in the specified directory. The files are only read once,
+    and the resulting dictionary is shared by all games.
 
     Returns:
         dict[str, str]: A dictionary mapping openings to their descriptions.
@@ -33,35 +39,56 @@ def _openingBookInit() -> dict[str, str]:
         input_file = os.path.join(opening_book_dir, file_name)
         if not file_name.endswith(Constants.VALID_OPENING_BOOK_EXTENSION):
             continue
-        with open(input_file, 'r') as f:
-            content = f.read()
-            start_index = content.find(Constants.OPENING_START_MARKER) + len(Constants.OPENING_START_MARKER)
-            end_index = content.find(Constants.OPENING_END_MARKER)
-            relevant_section = content[start_index:end_index]
-            pattern = re.compile(Constants.OPENING_PATTERN)
-            matches = pattern.findall(relevant_section)
-            openingBook.update({match[2]: match[1] for match in matches})
+        if os.path.getsize(input_file) == 0:  # An empty file can't be mapped.
+            continue
+        with open(input_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            start_index = content.find(_OPENING_START_MARKER) + len(_OPENING_START_MARKER)
+            end_index = content.find(_OPENING_END_MARKER)
+            if end_index == -1:  # Like slicing up to -1, the last byte is left out.
+                end_index = len(content) - 1
+            for match in _OPENING_RE.finditer(content, start_index, end_index):
+                openingBook[match[3].decode(Constants.OPENING_BOOK_ENCODING)] = \
+                    match[2].decode(Constants.OPENING_BOOK_ENCODING)
     return openingBook
 
 
-def _addMoveOrder(moveNum: int, move: str) -> str:
+@lru_cache(maxsize=1)
+def _openingPrefixes() -> frozenset[str]:
+    """
+    Get every prefix of the opening book's lines, cut between moves. A gameplay that isn't one of them can't reach
+    any opening, however it continues.
+
+    Returns:
+        frozenset[str]: The prefixes of the opening book's keys, including the keys themselves.
+    """
+
+    prefixes = set()
+    for line in _openingBookInit():
+        end = line.find(' ')
+        while end != -1:
+            prefixes.add(line[:end])
+            end = line.find(' ', end + 1)
+        prefixes.add(line)
+    return frozenset(prefixes)
+
+
+@lru_cache(maxsize=None)
+def _moveOrderPrefix(moveNum: int) -> str:
     """
-    Add move numbering to the move string for proper game notation.
+    Get the text preceding a move in the opening book's lines: the separator from the previous move, followed by the
+    move numbering for white's moves. It's only asked for plies within the book's depth, so few are ever cached.
 
     Args:
-        moveNum (int): The move number.
-        move (str): The move string.
+        moveNum (int): The move number, counted in plies from 0.
 
     Returns:
-        str: The move string with move numbering.
+        str: The text preceding the move.
     """
-    
-    cur_move = ""
+
+    separator = ' ' if moveNum else ''
     if moveNum % 2 == 0:
-        cur_move += str(int((moveNum / 2) + 1)) + ". "  # Move numbering pattern as the key in the
-        # openingBook dictionary.
-    cur_move += move
-    return cur_move
+        return separator + str(moveNum // 2 + 1) + ". "  # Move numbering pattern as the key in the openingBook.
+    return separator
 
 
 def _parseTime(time: str) -> int:
@@ -75,12 +102,11 @@ def _parseTime(time: str) -> int:
         int: The total time in seconds.
     """
     
-    pattern = Constants.TIME_PATTERN
-    match = re.match(pattern, time)
-    hours = int(match.group(1))
-    minutes = int(match.group(2))
-    seconds = int(match.group(3))
-    fractional = float(match.group(4)) if match.group(4) else 0
+    # Like the pattern this replaced, only the first three fields are read, so 'd:d:d:d.d' clocks still parse.
+    hours, minutes, seconds = time.split(Constants.TIME_SEPERATOR, 3)[:3]
+    seconds, _, fraction = seconds.partition(Constants.FRACTION_SEPERATOR)
+    hours, minutes, seconds = int(hours), int(minutes), int(seconds)
+    fractional = float(Constants.FRACTION_SEPERATOR + fraction) if fraction else 0
     return (hours * Constants.NORMALIZED_HOURS + minutes *
             Constants.NORMALIZED_MINUTES + seconds * Constants.NORMALIZED_SECONDS + fractional)
 
@@ -97,6 +123,11 @@ def extractTimeControl(timeControl: str) -> Tuple[int, int]:
     """
     
     assert isinstance(timeControl, str), Constants.INVALID_TIME_CONTROL
+    return _splitTimeControl(timeControl)
+
+
+@lru_cache(maxsize=Constants.PARSE_CACHE_SIZE)
+def _splitTimeControl(timeControl: str) -> Tuple[int, int]:
     parts = timeControl.split(Constants.TIME_CONTROL_SEPERATOR, 1)
 
     timeControl = parts[0]
@@ -143,14 +174,140 @@ def parseDate(date: str) -> datetime:
     
     if date is None:
         return datetime.today()
-    date = date.split(Constants.DATE_SEPERATOR)
-    for i in range(1, 3):
-        if date[i].startswith("0"):
-            date[i] = date[i][1]
-    return datetime(int(date[0]), int(date[1]), int(date[2]))
+    return _parseDateString(date)
+
+
+@lru_cache(maxsize=Constants.PARSE_CACHE_SIZE)
+def _parseDateString(date: str) -> datetime:
+    year, month, day = date.split(Constants.DATE_SEPERATOR)
+    return datetime(int(year), int(month), int(day))
+
+
+def engineConfig(stockfish: Stockfish, path: str) -> dict[str, Any]:
+    """
+    Get the arguments needed to start another Stockfish engine configured like the given one.
+
+    Args:
+        stockfish (Stockfish): The engine to replicate.
+        path (str): The path of the Stockfish executable the engine runs.
+
+    Returns:
+        dict[str, Any]: Keyword arguments for the Stockfish constructor.
+    """
+
+    return {'path': path, 'depth': _engineDepth(stockfish), 'parameters': _engineParameters(stockfish)}
+
+
+def configureEngine(stockfish: Stockfish) -> None:
+    """
+    Give a Stockfish engine a transposition table large enough to carry work over between the positions of a game.
+    A smaller table is enlarged once here, since resizing it clears it.
+
+    Args:
+        stockfish (Stockfish): The engine to configure.
+    """
+
+    if int(_engineParameters(stockfish).get(Constants.ENGINE_HASH_PARAMETER, 0)) < Constants.MINIMUM_ENGINE_HASH_MB:
+        stockfish.update_engine_parameters({Constants.ENGINE_HASH_PARAMETER: Constants.MINIMUM_ENGINE_HASH_MB})
+
+
+def _engineParameters(stockfish: Stockfish) -> dict[str, Any]:
+    """
+    Get the UCI parameters a Stockfish engine is configured with.
+
+    Args:
+        stockfish (Stockfish): The engine.
+
+    Returns:
+        dict[str, Any]: The engine parameters.
+    """
+
+    # Older releases of the stockfish package expose `get_parameters`, newer ones `get_engine_parameters`.
+    if hasattr(stockfish, 'get_engine_parameters'):
+        return stockfish.get_engine_parameters()
+    return stockfish.get_parameters()
+
+
+def _engineDepth(stockfish: Stockfish) -> int:
+    """
+    Get the search depth a Stockfish engine is configured with.
+
+    Args:
+        stockfish (Stockfish): The engine.
+
+    Returns:
+        int: The search depth.
+    """
+
+    # Older releases of the stockfish package expose `depth`, newer ones `get_depth`.
+    return int(stockfish.get_depth() if hasattr(stockfish, 'get_depth') else stockfish.depth)
+
+
+def _setEnginePosition(stockfish: Stockfish, fen: str) -> None:
+    """
+    Set the position a Stockfish engine will evaluate, keeping the engine's transposition table.
+
+    Args:
+        stockfish (Stockfish): The engine.
+        fen (str): The position to set.
+    """
+
+    # Older releases of the stockfish package send `ucinewgame`, clearing the table, unless told not to. Newer ones
+    # never send it and don't accept the argument.
+    if _acceptsUcinewgameToken(type(stockfish)):
+        stockfish.set_fen_position(fen, send_ucinewgame_token=False)
+    else:
+        stockfish.set_fen_position(fen)
+
+
+@lru_cache(maxsize=None)
+def _acceptsUcinewgameToken(engineType: type) -> bool:
+    return Constants.UCINEWGAME_TOKEN_ARG in inspect.signature(engineType.set_fen_position).parameters
+
+
+# Evaluations already computed by each engine, keyed by (EPD, depth). The EPD leaves out the move counters, so a
+# position is found again however it was reached. Games share most of their opening positions, so this saves
+# re-searching them for every game. Each engine keeps its EVAL_CACHE_SIZE most recently used evaluations, and they
+# go away together with the engine.
+_evalCache: 'WeakKeyDictionary[Stockfish, OrderedDict[Tuple[str, int], int]]' = WeakKeyDictionary()
+
+
+_workerStockfish: Union[Stockfish, None] = None
+
+
+def _initAnalysisWorker(stockfishConfig: dict[str, Any]) -> None:
+    """
+    Start the Stockfish engine owned by an analysis worker process.
+
+    Args:
+        stockfishConfig (dict[str, Any]): Keyword arguments for the Stockfish constructor.
+    """
+
+    global _workerStockfish
+    _workerStockfish = Stockfish(**stockfishConfig)
+
+
+def _analyzeInWorker(game: 'SingleGame') -> 'SingleGame':
+    """
+    Analyze a game inside a worker process using the worker's own engine.
+
+    Args:
+        game (SingleGame): The unpickled game to analyze.
+
+    Returns:
+        SingleGame: The analyzed game, to be folded back into the parent's instance.
+    """
+
+    game._stockfish = _workerStockfish
+    game.analyzeGame()
+    return game
 
 
 class SingleGame:
+    __slots__ = ('_isAnalyzed', '_pgn', '_openingBook', '_pgnWithClockFormat', '_board', '_stockfish', '_opponent',
+                 '_date', '_errorPerMove', '_timeSpentPerMove', '_whiteElo', '_blackElo', '_timeControl', '_bonusTime',
+                 '_userColor', '_gameResult', '_mainOpening', '_openingVariation', '_moveLeavingOpening')
+
     def __init__(self, pgn: str, whiteElo: int, blackElo: int, result: str, time_control: str,
                  userColor: ChessColor, stockfish: Stockfish, opponent: str, date: str) -> None:
         """
@@ -175,13 +332,12 @@ class SingleGame:
         self._pgnWithClockFormat: bool = self._isThereClk()
 
         self._board = chess.Board()
-        self._stockfish = stockfish
-        self._stockfish.set_fen_position(self._board.fen())
+        self._stockfish = stockfish  # Shared between games; positions are set on it only when evaluating.
         self._opponent = opponent
 
         self._date = parseDate(date)
 
-        self._errorPerMove: list[float] = []
+        self._errorPerMove: np.ndarray = np.empty(0, dtype=np.float64)
         self._timeSpentPerMove: list[float] = []
 
         self._whiteElo: int = whiteElo
@@ -191,9 +347,7 @@ class SingleGame:
         self._gameResult: ChessResult = self._extractGameResult(result)
         self._mainOpening: str = Constants.UNKNOWN_OPENING
         self._openingVariation: Union[str, type[None]] = None
-        self._moveLeavingOpening: int = 0
-
-        self._initOpenings()
+        self._moveLeavingOpening: int = 0  # The opening fields are filled in by the analysis.
 
         self._validate_pgn()
 
@@ -210,30 +364,45 @@ class SingleGame:
         Returns:
             SingleGame: A deep copy of the instance.
         """
-        
-        new_instance = SingleGame(
-            self._pgn,
-            self._whiteElo,
-            self._blackElo,
-            ChessResult.chessResultToStr(self._gameResult),
-            Constants.DEFAULT_TIME_CONTROL,
-            self._userColor,
-            self._stockfish,
-            self._opponent,
-            Constants.DEFAULT_FROM_DATE_VALUE
-        )
-
-        new_instance._timeControl, new_instance._time_control_bonus = self._timeControl, self._bonusTime
-        new_instance.date = self._date
-
-        new_instance.errorPerMove = deepcopy(self._errorPerMove)
-        new_instance.timeSpentPerMove = deepcopy(self._timeSpentPerMove)
-
-        new_instance._mainOpening = self._mainOpening
-        new_instance._openingVariation = self._openingVariation
+
+        # The constructor is skipped, since every field it would derive from the PGN is already known. Immutable
+        # fields, the shared opening book and the engine are taken as they are; only the mutable ones are copied.
+        new_instance = SingleGame.__new__(SingleGame)
+        for name in self.__slots__:
+            setattr(new_instance, name, getattr(self, name))
+
+        new_instance._board = self._board.copy()
+        new_instance._errorPerMove = self._errorPerMove.copy()
+        new_instance._timeSpentPerMove = list(self._timeSpentPerMove)
 
         return new_instance
 
+    def __getstate__(self):
+        """
+        Get the picklable state of the instance.
+
+        The Stockfish engine is a live subprocess and the opening book is package data, so both are left out and
+        restored when unpickling.
+
+        Returns:
+            dict: The instance state.
+        """
+
+        return {name: getattr(self, name) for name in self.__slots__ if name not in ('_stockfish', '_openingBook')}
+
+    def __setstate__(self, state):
+        """
+        Restore the instance from a pickled state.
+
+        Args:
+            state (dict): The instance state.
+        """
+
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._stockfish = None
+        self._openingBook = _openingBookInit()
+
     def _extractGameResult(self, result: str) -> ChessResult:
         """
         Extract the game result from the result string.
@@ -259,36 +428,33 @@ class SingleGame:
         Returns:
             bool: True if the PGN contains clock format, False otherwise.
         """
-        
-        clock_pattern = re.compile(Constants.CLOCK_PATTERN)
 
-        # Split the content by spaces and check each part
-        parts = self._pgn.split()
+        return _CLOCK_RE.search(self._pgn) is not None
 
-        for part in parts:
-            if clock_pattern.match(part):
-                return True
+    def _extendOpening(self, gameplay: str, moveNum: int, move: str, userMove: bool) -> Union[str, type[None]]:
+        """
+        Extend the gameplay with the next move, updating the main opening and variation it reaches.
 
-        return False
+        Args:
+            gameplay (str): The gameplay so far.
+            moveNum (int): The number of the move, counted in plies from 0.
+            move (str): The move in SAN.
+            userMove (bool): Whether the move is the user's.
 
-    def _initOpenings(self) -> None:
-        """Initialize the main opening and variation from the PGN."""
-        
-        pgn: list[str] = self._sanitize_pgn()
-        gameplay = []
-        turn = ChessColor.WHITE
-        board = chess.Board()
-        for moveNum, move in enumerate(pgn):
-            gameplay.append(_addMoveOrder(moveNum, move))
-            board.push_san(move)
-            if self._updateOpeningAndVariation(' '.join(gameplay)) and turn == self._userColor:
-                self._increaseMoveLeavingOpening()
+        Returns:
+            Union[str, None]: The extended gameplay, or None once it can't reach any opening.
+        """
 
-            turn = _changeTurn(turn)
+        gameplay = gameplay + _moveOrderPrefix(moveNum) + move
+        if gameplay not in _openingPrefixes():
+            return None
+        if self._updateOpeningAndVariation(gameplay) and userMove:
+            self._increaseMoveLeavingOpening()
+        return gameplay
 
     def analyzeGame(self) -> bool:
         """
-        Analyze the game and calculate move errors.
+        Analyze the game in one pass over its moves, finding its opening and calculating move errors.
 
         Returns:
             bool: True if the game was successfully analyzed, False otherwise.
@@ -298,21 +464,68 @@ class SingleGame:
             return False
 
         pgn: list[str] = self._sanitize_pgn()
-        turn = ChessColor.WHITE
-        beforeTurnEval: int = self._calculateEval()
+        evals = np.empty(len(pgn) + 1, dtype=np.int64)  # The evaluation before the game and after each move.
+        evals[0] = self._calculateEval()
+        gameplay = ''
+        userMove = self._userColor == ChessColor.WHITE
         for moveNum, move in enumerate(pgn):
-
             self._board.push_san(move)
-            afterTurnEval: int = self._calculateEval()
+            if gameplay is not None:
+                gameplay = self._extendOpening(gameplay, moveNum, move, userMove)
+            evals[moveNum + 1] = self._calculateEval()
 
-            if turn == self._userColor:
-                self._calculateMoveError(beforeTurnEval, afterTurnEval)
-            beforeTurnEval = afterTurnEval
+            userMove = not userMove
 
-            turn = _changeTurn(turn)
+        self._calculateMoveErrors(evals)
         self._isAnalyzed = True
         return True
 
+    def adoptAnalysis(self, analyzed: 'SingleGame') -> None:
+        """
+        Take over the analysis results of a copy of this game that was analyzed elsewhere (e.g. in a worker process).
+
+        Args:
+            analyzed (SingleGame): The analyzed copy of this game.
+        """
+
+        self._errorPerMove = analyzed._errorPerMove
+        self._timeSpentPerMove = analyzed._timeSpentPerMove
+        self._board = analyzed._board
+        self._mainOpening = analyzed._mainOpening
+        self._openingVariation = analyzed._openingVariation
+        self._moveLeavingOpening = analyzed._moveLeavingOpening
+        self._isAnalyzed = analyzed._isAnalyzed
+
+    @classmethod
+    def analyzeGames(cls, games: list['SingleGame'], workers: int = Constants.DEFAULT_WORKERS,
+                     stockfishPath: str = Constants.DEFAULT_STOCKFISH_PATH) -> Iterator['SingleGame']:
+        """
+        Analyze a batch of games, spreading the work over a pool of processes when more than one worker is given.
+        Each worker runs its own Stockfish engine, configured like the engine of the first game.
+
+        Args:
+            games (list[SingleGame]): The games to analyze.
+            workers (int): The number of processes analyzing games in parallel. Defaults to 1 (analysis runs in this
+                process).
+            stockfishPath (str): The path of the Stockfish executable the workers run. Defaults to "stockfish".
+
+        Yields:
+            SingleGame: Each game once it's analyzed, in the order given.
+        """
+
+        if workers <= 1 or len(games) <= 1:
+            for game in games:
+                game.analyzeGame()
+                yield game
+            return
+
+        chunkSize = max(1, len(games) // (workers * Constants.ANALYSIS_CHUNKS_PER_WORKER))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_initAnalysisWorker,
+                                 initargs=(engineConfig(games[0]._stockfish, stockfishPath),)) as executor:
+            for game, analyzed in zip(games, executor.map(_analyzeInWorker, games, chunksize=chunkSize)):
+                game.adoptAnalysis(analyzed)
+                yield game
+
     def _sanitize_pgn(self) -> list[str]:
         """
         Sanitize the PGN string and extract the moves.
@@ -339,15 +552,17 @@ class SingleGame:
         
         prev_time, starting_ind = self._initTimeControl(pgn)
         bonusTime = self._bonusTime * Constants.NORMALIZED_SECONDS
-        prev_time += bonusTime
-        for i in range(starting_ind, len(pgn), Constants.NEXT_MOVE_JUMP):
-            cur_time = _parseTime(pgn[i])
-            normalized_seconds = round((prev_time - cur_time) / Constants.NORMALIZED_SECONDS,
-                                       Constants.ROUNDING_ERROR)
-            self._timeSpentPerMove.append(normalized_seconds)
-            prev_time = cur_time + bonusTime
-
-        return [pgn[idx] for idx in range(len(pgn)) if idx % 2 == 0]
+        clocks = np.fromiter((_parseTime(clock) for clock in pgn[starting_ind::Constants.NEXT_MOVE_JUMP]),
+                             dtype=np.float64)
+        # The clock before each of the user's moves, with the bonus of their previous move added.
+        previousClocks = np.empty_like(clocks)
+        previousClocks[:1] = prev_time
+        previousClocks[1:] = clocks[:-1]
+        timeSpent = (previousClocks + bonusTime - clocks) / Constants.NORMALIZED_SECONDS
+        # Python's round is kept, since clocks with fractions give exact ties that np.round may round differently.
+        self._timeSpentPerMove = [round(spent, Constants.ROUNDING_ERROR) for spent in timeSpent.tolist()]
+
+        return pgn[::2]
 
     def _initTimeControl(self, pgn: list[str]) -> Tuple[int, int]:
         """
@@ -371,20 +586,42 @@ class SingleGame:
     def _validate_pgn(self) -> None:
         """Validate the PGN string to ensure it meets the minimum move requirements."""
         
-        pgn = self._pgn.split(' ')
-        if self._isThereClk() and len(pgn) < Constants.MINIMUM_NUMBER_OF_MOVES_WITH_CLOCK_FORMAT:
-            raise ValueError(Constants.MINIMUM_MOVES_ERR)
-        if not self._isThereClk() and len(pgn) < Constants.MINIMUM_NUMBER_OF_MOVES_WITHOUT_CLOCK_FORMAT:
+        minimumTokens = (Constants.MINIMUM_NUMBER_OF_MOVES_WITH_CLOCK_FORMAT if self._pgnWithClockFormat
+                         else Constants.MINIMUM_NUMBER_OF_MOVES_WITHOUT_CLOCK_FORMAT)
+        if self._pgn.count(' ') + 1 < minimumTokens:  # The number of tokens split(' ') would give.
             raise ValueError(Constants.MINIMUM_MOVES_ERR)
 
     def _calculateEval(self) -> int:
         """
-        Calculate the evaluation of the current board position using Stockfish.
+        Calculate the evaluation of the current board position using Stockfish, reusing the evaluation of a
+        position this engine has already seen.
 
         Returns:
             int: The evaluation value.
         """
-        
+
+        key = (self._board.epd(), _engineDepth(self._stockfish))
+        engineCache = _evalCache.get(self._stockfish)
+        if engineCache is None:
+            engineCache = _evalCache[self._stockfish] = OrderedDict()
+        if key in engineCache:
+            engineCache.move_to_end(key)
+            return engineCache[key]
+
+        _setEnginePosition(self._stockfish, self._board.fen())
+        evaluation = engineCache[key] = self._evaluate()
+        if len(engineCache) > Constants.EVAL_CACHE_SIZE:
+            engineCache.popitem(last=False)
+        return evaluation
+
+    def _evaluate(self) -> int:
+        """
+        Evaluate the engine's current position.
+
+        Returns:
+            int: The evaluation value.
+        """
+
         StockEval = self._stockfish.get_evaluation()
         mateDetector = StockEval['type']
         value = StockEval['value']
@@ -396,16 +633,16 @@ class SingleGame:
         else:
             return value
 
-    def _calculateMoveError(self, beforeTurnEval: int, afterTurnEval: int) -> None:
+    def _calculateMoveErrors(self, evals: np.ndarray) -> None:
         """
-        Calculate the error for a move based on the change in evaluation.
+        Calculate the error of each of the user's moves based on the change in evaluation it caused.
 
         Args:
-            beforeTurnEval (int): The evaluation before the move.
-            afterTurnEval (int): The evaluation after the move.
+            evals (np.ndarray): The evaluation before the game and after each move.
         """
-        
-        self._errorPerMove.append(abs(beforeTurnEval - afterTurnEval) / Constants.NORMALIZED_ERROR)
+
+        firstUserPly = 0 if self._userColor == ChessColor.WHITE else 1
+        self._errorPerMove = np.abs(np.diff(evals)[firstUserPly::2]) / Constants.NORMALIZED_ERROR
 
     def _updateOpeningAndVariation(self, gameplay: str) -> bool:
         """
@@ -575,14 +812,14 @@ class SingleGame:
             list[float]: The list of error per move.
         """
         
-        return self._errorPerMove
+        return self._errorPerMove.tolist()
 
     def getOpeningBook(self) -> dict[str, str]:
         """
         Get the opening book.
 
         Returns:
-            dict[str, str]: The opening book dictionary.
+            dict[str, str]: The opening book dictionary, shared by all games.
         """
         
         return self._openingBook
@@ -596,7 +833,7 @@ class SingleGame:
             float: The average error of the game.
         """
         
-        return sum(self._errorPerMove) / len(self._errorPerMove)
+        return float(self._errorPerMove.mean())
 
     def getOpponent(self) -> str:
         """